@@ -2,9 +2,13 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.contenttypes.admin import GenericStackedInline
 from django.utils.html import format_html
+from django.utils.translation import ungettext
 
 from core import forms
 from core import models
+from core.pagination import EstimatedCountPaginator
+from core.product import approve_products
+from core.vendor import bulk_store_locations
 from landing import models as landing_models
 from modeltranslation.admin import TranslationAdmin, TranslationStackedInline
 
@@ -14,6 +18,7 @@ admin_models = [
     models.Sample,
     models.OverviewType,
     models.PeriodOverview,
+    models.OverviewWatermark,
 ]
 
 for m in admin_models:
@@ -42,6 +47,32 @@ class CoreUserAdmin(UserAdmin):
     filter_horizontal = ()
 
 
+class LargeTableAdminMixin(object):
+    """
+    Changelist of a table too big to count on every page.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+class SystemLogAdmin(admin.ModelAdmin):
+    list_display = ('id', 'level', 'message', 'create_date')
+    list_filter = ('level', 'create_date')
+    # Counting millions of logs on every page is slower than the listing itself.
+    show_full_result_count = False
+
+
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    list_display = ('id', 'subject', 'status', 'attempts', 'created', 'sent')
+    list_filter = ('status',)
+    readonly_fields = ('attempts', 'last_error', 'created', 'sent')
+
+
+class LowStockAlertAdmin(admin.ModelAdmin):
+    list_display = ('id', 'product_unit', 'store', 'quantity', 'threshold', 'created', 'resolved')
+    raw_id_fields = ('product_unit', 'store')
+
+
 class ImageInlineAdmin(GenericStackedInline):
     model = models.Image
     form = forms.ImageForm
@@ -141,23 +172,41 @@ class StoreAdmin(TranslationAdmin):
     form = forms.StoreForm
     readonly_fields = ('countries',)
 
+    def save_related(self, request, form, formsets, change):
+        # Countries are updated once for all the locations of the form.
+        with bulk_store_locations():
+            super(StoreAdmin, self).save_related(request, form, formsets, change)
+
 
 class ProductUnitAdmin(admin.StackedInline):
     model = models.ProductUnit
     min_num = 1
     extra = 0
+    raw_id_fields = ('attributes',)
 
 
-class UnApprovedProductAdmin(TranslationAdmin):
+class UnApprovedProductAdmin(LargeTableAdminMixin, TranslationAdmin):
     inlines = (ProductUnitAdmin,)
     form = forms.ProductForm
     list_display = ('id', 'name', 'store', 'price', 'category', 'is_active')
+    list_select_related = ('store', 'category')
+    # Popular in is limited to the store countries by the form.
+    raw_id_fields = ('store', 'category', 'image', 'attributes', 'infographics')
+    actions = ('approve',)
+
+    def approve(self, request, queryset):
+        approved = approve_products(queryset)
+        self.message_user(request, ungettext('%d product approved', '%d products approved', approved) % approved)
+
+    approve.short_description = 'Approve selected products'
 
 
-class ProductAdmin(TranslationAdmin):
+class ProductAdmin(LargeTableAdminMixin, TranslationAdmin):
     inlines = (ProductUnitAdmin,)
     form = forms.ProductForm
     list_display = ('id', 'name', 'store', 'price', 'category', 'is_active')
+    list_select_related = ('store', 'category')
+    raw_id_fields = ('store', 'category', 'image', 'attributes', 'infographics')
 
     def get_queryset(self, request):
         return super(ProductAdmin, self).get_queryset(request).filter(is_approved=True)
@@ -170,11 +219,13 @@ class OrderItemInline(admin.StackedInline):
     form = forms.OrderItemForm
 
 
-class OrderAdmin(admin.ModelAdmin):
+class OrderAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     inlines = (OrderItemInline,)
     form = forms.OrderCreateForm
     readonly_fields = ('total_quantity', 'total_price')
     list_display = ('id', 'consumer', 'store', 'created')
+    list_select_related = ('consumer__user', 'store')
+    raw_id_fields = ('consumer', 'store')
 
 
 class ShowroomInline(admin.StackedInline):
@@ -209,10 +260,14 @@ class ProductSampleUnitAdmin(admin.StackedInline):
     model = models.ProductSampleUnits
     extra = 0
     min_num = 1
+    raw_id_fields = ('product_unit',)
 
 
-class SampleDispatchAdmin(admin.ModelAdmin):
+class SampleDispatchAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     inlines = (ProductSampleUnitAdmin,)
+    list_display = ('id', 'store', 'warehouse', 'status', 'created')
+    list_select_related = ('store', 'warehouse')
+    raw_id_fields = ('store', 'warehouse', 'received_by')
 
 
 class RegionAdmin(TranslationAdmin):
@@ -272,3 +327,6 @@ admin.site.register(landing_models.SignUpRequest, SignUpRequestAdmin)
 admin.site.register(models.Showroom, ShowroomAdmin)
 
 admin.site.site_header = 'Oumimen Administration'
+admin.site.register(models.SystemLog, SystemLogAdmin)
+admin.site.register(models.OutgoingEmail, OutgoingEmailAdmin)
+admin.site.register(models.LowStockAlert, LowStockAlertAdmin)
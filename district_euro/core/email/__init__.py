@@ -1 +1 @@
-from .logic import send_mail_join_request
\ No newline at end of file
+from .logic import queue_mail, send_mail_join_request, send_mail_low_stock, send_queued_emails
@@ -1,29 +1,134 @@
+import datetime
 import logging
 
-from django.core.mail import send_mail
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
 from django.template.loader import render_to_string
+from django.utils import timezone
 
+from core import models
 from core.app_settings import SITE_NAME
-from district_euro import settings as de_settings
 
 logger = logging.getLogger(__name__)
 
+# Failed emails are retried after RETRY_DELAY seconds, doubling the delay on every attempt.
+MAX_ATTEMPTS = 5
+RETRY_DELAY = 60
+# Seconds a worker has to send the emails it claimed, emails of a worker that died are sent again after them.
+CLAIM_TIMEOUT = 600
 
-def get_admin_email():
-    return 'joaquin@asap.uy'
+
+def get_admin_emails():
+    return settings.JOIN_REQUEST_EMAILS
+
+
+def queue_mail(subject, message, recipient_list, html_message=None, from_email=None):
+    """
+    Saves an email to be sent by send_queued_emails. It belongs to the current transaction, the email is not sent
+    if the transaction is rolled back.
+
+    :rtype: models.OutgoingEmail
+    """
+    return models.OutgoingEmail.objects.create(subject=subject, body=message, html_body=html_message,
+                                               from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+                                               recipients=list(recipient_list))
 
 
 def send_mail_join_request(join_request):
+    admin_emails = get_admin_emails()
+    if not admin_emails:
+        return
+
     email_context = {'join_request': join_request}
     email_content = render_to_string('email/join_request_email.txt', email_context)
     html_content = render_to_string('email/join_request_email.html', email_context)
 
-    admin_email = get_admin_email()
-
     email_subject = "[%s] New Join Request" % SITE_NAME
+    queue_mail(email_subject, email_content, admin_emails, html_message=html_content)
+
+
+def send_mail_low_stock(store, alerts):
+    email_context = {'store': store, 'alerts': alerts}
+    email_content = render_to_string('email/low_stock_email.txt', email_context)
+
+    email_subject = "[%s] Low stock in %s" % (SITE_NAME, store.name)
+    queue_mail(email_subject, email_content, [store.vendor.user.email])
+
+
+def _send(email, connection):
+    message = EmailMultiAlternatives(email.subject, email.body, email.from_email, email.recipients,
+                                     connection=connection)
+    if email.html_body:
+        message.attach_alternative(email.html_body, 'text/html')
+    message.send()
+
+
+def _claim_emails(batch_size):
+    """
+    Takes a batch of the due pending emails for this worker, postponing them by CLAIM_TIMEOUT so concurrent workers
+    skip them.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        emails = list(models.OutgoingEmail.objects.select_for_update()
+                      .filter(status=models.OutgoingEmail.PENDING, next_attempt__lte=now)
+                      .order_by('next_attempt', 'id')[:batch_size])
+        if emails:
+            models.OutgoingEmail.objects.filter(pk__in=[email.pk for email in emails]) \
+                .update(next_attempt=now + datetime.timedelta(seconds=CLAIM_TIMEOUT))
+    return emails
+
+
+def send_queued_emails(batch_size=50, max_attempts=MAX_ATTEMPTS):
+    """
+    Sends a batch of the pending emails that are due, all of them through one connection.
+
+    Emails are claimed in a short transaction before sending so concurrent workers do not send them twice, and the
+    state of each email is saved right after it is sent. If the worker dies, only the email being sent may be sent
+    again. A failed email is retried later with exponential backoff, after max_attempts it is marked as failed.
+
+    :rtype: tuple
+    :return: amount of emails sent and amount of emails that failed.
+    """
+    sent = failed = 0
+    emails = _claim_emails(batch_size)
+    if not emails:
+        return sent, failed
+
+    connection = get_connection()
     try:
-        send_mail(email_subject, email_content, de_settings.DEFAULT_FROM_EMAIL, [admin_email], fail_silently=False,
-                  html_message=html_content)
-        logger.info('Join request #%d email sent to %s', join_request.id, admin_email)
+        connection.open()
     except Exception as e:
-        logger.critical('Sending join request (#%d) email notification error: %s', join_request.id, e)
+        # Emails are left pending, the mail server is not their fault.
+        logger.error('Could not connect to the mail server: %s', e)
+        models.OutgoingEmail.objects.filter(pk__in=[email.pk for email in emails]) \
+            .update(next_attempt=timezone.now())
+        return sent, failed
+    try:
+        for email in emails:
+            try:
+                _send(email, connection)
+            except Exception as e:
+                failed += 1
+                email.attempts += 1
+                email.last_error = unicode(e)
+                if email.attempts >= max_attempts:
+                    email.status = models.OutgoingEmail.FAILED
+                    logger.critical('Sending email #%d to %s failed, giving up: %s', email.id,
+                                    ', '.join(email.recipients), e)
+                else:
+                    delay = RETRY_DELAY * 2 ** (email.attempts - 1)
+                    email.next_attempt = timezone.now() + datetime.timedelta(seconds=delay)
+                    logger.error('Sending email #%d to %s failed, retrying in %d seconds: %s', email.id,
+                                 ', '.join(email.recipients), delay, e)
+            else:
+                sent += 1
+                email.attempts += 1
+                email.status = models.OutgoingEmail.SENT
+                email.sent = timezone.now()
+                logger.info('Email #%d sent to %s', email.id, ', '.join(email.recipients))
+            email.save(update_fields=('status', 'attempts', 'next_attempt', 'last_error', 'sent'))
+    finally:
+        connection.close()
+    return sent, failed
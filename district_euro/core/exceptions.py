@@ -15,3 +15,8 @@ class FileTooBigException(APIException):
 class InvalidImageFileException(APIException):
     status_code = 400
     default_detail = _('File is not an image')
+
+
+class InvalidOrderError(APIException):
+    status_code = 400
+    default_detail = _('Invalid order')
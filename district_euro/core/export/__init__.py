@@ -0,0 +1,2 @@
+from .logic import export_response, iterate_chunked, order_rows, inventory_rows, ORDER_HEADER, INVENTORY_HEADER, \
+    EXPORT_FORMATS, CSV, XLSX
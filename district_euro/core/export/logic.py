@@ -0,0 +1,159 @@
+import codecs
+import csv
+import tempfile
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from openpyxl import Workbook
+from openpyxl.writer.write_only import WriteOnlyCell
+
+from core import models
+
+CSV = 'csv'
+XLSX = 'xlsx'
+
+EXPORT_FORMATS = {
+    CSV: 'text/csv; charset=utf-8',
+    XLSX: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+# Rows fetched per query while exporting.
+CHUNK_SIZE = 1000
+
+# Bytes per chunk of the xlsx file.
+FILE_CHUNK_SIZE = 64 * 1024
+
+# Spreadsheets run text starting with these as formulas, names and addresses are user input.
+FORMULA_PREFIXES = ('=', '+', '-', '@')
+
+ORDER_HEADER = ('Order', 'Date', 'Status', 'Total', 'Currency', 'Quantity', 'Consumer', 'Shipping address',
+                'Tracking number', 'Shipping company')
+
+INVENTORY_HEADER = ('Unit', 'Product', 'SKU', 'Name', 'Price', 'Currency', 'Quantity', 'Attributes', 'Approved')
+
+
+def iterate_chunked(queryset, chunk_size=CHUNK_SIZE):
+    """
+    Iterates a queryset in primary key order, chunk_size rows per query, so memory does not grow with the number of
+    rows. Prefetched relations are fetched per chunk. Rows of values() querysets must include the primary key.
+    """
+    pk_name = queryset.model._meta.pk.attname
+    queryset = queryset.order_by('pk')
+    last_pk = None
+    while True:
+        chunk = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        rows = list(chunk[:chunk_size])
+        for row in rows:
+            yield row
+        if len(rows) < chunk_size:
+            return
+        last_pk = rows[-1][pk_name] if isinstance(rows[-1], dict) else rows[-1].pk
+
+
+def _local(value):
+    # Spreadsheets have no time zones.
+    return timezone.localtime(value).replace(tzinfo=None, microsecond=0)
+
+
+def order_rows(queryset):
+    """
+    Yields a tuple per order, with the columns of ORDER_HEADER.
+    """
+    queryset = queryset.values('id', 'created', 'status', 'total_price', 'total_price_currency', 'total_quantity',
+                               'consumer__user__first_name', 'consumer__user__last_name', 'shipping_address',
+                               'tracking_number', 'shipping_company')
+    for row in iterate_chunked(queryset):
+        consumer = u' '.join(name for name in (row['consumer__user__first_name'], row['consumer__user__last_name'])
+                             if name)
+        yield (row['id'], _local(row['created']), unicode(models.Order.STATUS_DICT.get(row['status'], row['status'])),
+               row['total_price'], row['total_price_currency'], row['total_quantity'], consumer,
+               row['shipping_address'], row['tracking_number'], row['shipping_company'])
+
+
+def inventory_rows(queryset):
+    """
+    Yields a tuple per product unit, with the columns of INVENTORY_HEADER. Units should come with their product and
+    their attributes prefetched.
+    """
+    for unit in iterate_chunked(queryset):
+        product = unit.product
+        attributes = u', '.join(unicode(value) for value in unit.attributes.all())
+        yield (unit.id, product.id, unit.sku, product.name, product.price.amount, unicode(product.price.currency),
+               unit.quantity, attributes, product.is_approved)
+
+
+class _Echo(object):
+    def write(self, value):
+        return value
+
+
+def _is_formula(value):
+    return isinstance(value, basestring) and value.startswith(FORMULA_PREFIXES)
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if _is_formula(value):
+        # The quote makes spreadsheets read the cell as text.
+        value = u"'" + value
+    if isinstance(value, unicode):
+        return value.encode('utf-8')
+    return value
+
+
+def _xlsx_value(sheet, value):
+    if not _is_formula(value):
+        return value
+    # openpyxl writes text starting with = as a formula, text cells are never evaluated.
+    cell = WriteOnlyCell(sheet, value=value)
+    cell.data_type = cell.TYPE_STRING
+    return cell
+
+
+def _stream_csv(header, rows):
+    writer = csv.writer(_Echo())
+    # Without the BOM excel reads the file as latin-1.
+    yield codecs.BOM_UTF8
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow([_csv_value(value) for value in row])
+
+
+def _stream_xlsx(header, rows, title):
+    # Write only workbooks keep their rows in temporary files instead of memory. The file is only valid once the
+    # workbook is saved, so nothing is sent until every row is written.
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=title)
+    sheet.append(header)
+    for row in rows:
+        sheet.append([_xlsx_value(sheet, value) for value in row])
+    with tempfile.TemporaryFile() as output:
+        workbook.save(output)
+        output.seek(0)
+        for chunk in iter(lambda: output.read(FILE_CHUNK_SIZE), b''):
+            yield chunk
+
+
+def export_response(file_format, filename, header, rows):
+    """
+    Returns rows as a CSV or XLSX attachment. CSV rows are read while the response is sent. XLSX files are built in
+    a temporary file first and sent once complete, the response starts after every row is written.
+
+    Text starting with =, +, - or @ is kept as text instead of being run as a formula.
+
+    :type file_format: str
+    :param file_format: one of EXPORT_FORMATS.
+
+    :type rows: iterable
+    :param rows: tuples with the columns of header.
+
+    :rtype: StreamingHttpResponse
+    """
+    if file_format == XLSX:
+        content = _stream_xlsx(header, rows, filename)
+    else:
+        content = _stream_csv(header, rows)
+    response = StreamingHttpResponse(content, content_type=EXPORT_FORMATS[file_format])
+    response['Content-Disposition'] = 'attachment; filename="%s.%s"' % (filename, file_format)
+    return response
@@ -1,5 +1,7 @@
 import moneyed
 from django import forms
+from django.contrib import admin
+from django.contrib.admin.widgets import ForeignKeyRawIdWidget
 from django.contrib.auth.forms import ReadOnlyPasswordHashField
 from django.utils.translation import gettext_lazy as _
 
@@ -8,9 +10,13 @@ from core.image import upload_image, upload_image2, delete_image
 
 
 class OrderItemForm(forms.ModelForm):
+    # Units are picked by id, listing them all would render every unit of every store.
     product_unit = forms.ModelChoiceField(required=True,
                                           queryset=models.ProductUnit.objects.select_related(
-                                              'product').prefetch_related('attributes').all())
+                                              'product').prefetch_related('attributes').all(),
+                                          widget=ForeignKeyRawIdWidget(
+                                              models.OrderItem._meta.get_field('product_unit').remote_field,
+                                              admin.site))
     quantity = forms.IntegerField(required=True)
 
     class Meta:
@@ -307,7 +313,7 @@ class ProductForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super(ProductForm, self).__init__(*args, **kwargs)
         if self.instance:
-            country_ids = models.StoreLocation.objects.filter(store=self.instance.store).values_list(
+            country_ids = models.StoreLocation.objects.filter(store_id=self.instance.store_id).values_list(
                 'region__city__country_id', flat=True)
             self.fields['popular_in'].queryset = models.Country.objects.filter(id__in=country_ids)
 
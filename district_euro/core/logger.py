@@ -1,4 +1,30 @@
+import collections
+import datetime
 import logging
+import os
+import sys
+import threading
+
+from django.utils import timezone
+
+
+def record_extra(record):
+    """
+    Structured context of a log record, stored in SystemLog.extra.
+    """
+    extra = {
+        'logger': record.name,
+        'module': record.module,
+        'function': record.funcName,
+        'line': record.lineno,
+    }
+    if record.exc_info:
+        extra['exception'] = logging.Formatter().formatException(record.exc_info)
+    return extra
+
+
+def record_date(record):
+    return datetime.datetime.fromtimestamp(record.created, timezone.utc)
 
 
 class DistrictEuroLoggingHandler(logging.Handler):
@@ -13,7 +39,128 @@ class DistrictEuroLoggingHandler(logging.Handler):
             if record and hasattr(record, 'levelname') and record.levelname is not None:
                 log_level = record.levelname
                 log_message = record.getMessage()
-                SystemLog.objects.create(level=log_level, message=log_message)
+                SystemLog.objects.create(level=log_level, message=log_message, extra=record_extra(record),
+                                         create_date=record_date(record))
         except Exception as e:
             print "[Database Logging failed] ::" + str(e)
         return
+
+
+class QueuedDistrictEuroLoggingHandler(logging.Handler):
+    """
+    Database logging handler that does not write on the thread that logs.
+
+    Records are kept in a bounded in memory queue and a background thread saves them with bulk_create every
+    batch_size records or every flush_interval milliseconds. The background thread has its own database
+    connection, so logs never join the transaction of the request that logged them. When the queue is full the
+    oldest records are dropped, dropped counts how many and a warning with the amount is saved on next write.
+    """
+
+    def __init__(self, level=logging.NOTSET, capacity=10000, batch_size=100, flush_interval=1000):
+        logging.Handler.__init__(self, level)
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval / 1000.0
+        self.dropped = 0
+        self._unreported_dropped = 0
+        self._queue = collections.deque()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._pid = None
+        self._closed = False
+
+    def _ensure_thread(self):
+        # Started on first record, and again in forked processes since threads do not survive a fork.
+        if self._thread is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='district-euro-db-logging')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def emit(self, record):
+        if not record or getattr(record, 'levelname', None) is None:
+            return
+        try:
+            entry = (record.levelname, record.getMessage(), record_extra(record), record_date(record))
+        except Exception:
+            self.handleError(record)
+            return
+        with self._condition:
+            if self._closed:
+                return
+            self._ensure_thread()
+            if len(self._queue) >= self.capacity:
+                self._queue.popleft()
+                self.dropped += 1
+                self._unreported_dropped += 1
+            self._queue.append(entry)
+            if len(self._queue) >= self.batch_size:
+                self._condition.notify()
+
+    def _save(self, entries):
+        from django.db import close_old_connections
+        from core.models import SystemLog
+        try:
+            # The connection of the thread is kept between batches, unless broken or older than CONN_MAX_AGE.
+            close_old_connections()
+            SystemLog.objects.bulk_create([SystemLog(level=level, message=message, extra=extra, create_date=date)
+                                           for level, message, extra, date in entries],
+                                          batch_size=self.batch_size)
+        except Exception as e:
+            sys.stderr.write('[Database Logging failed] ::%s\n' % e)
+
+    def _drain(self):
+        with self._condition:
+            entries = list(self._queue)
+            self._queue.clear()
+            dropped, self._unreported_dropped = self._unreported_dropped, 0
+        if dropped:
+            entries.append(('WARNING', '[Database Logging] %d log records dropped, queue is full' % dropped,
+                            {'logger': __name__, 'dropped': dropped}, timezone.now()))
+        if entries:
+            self._save(entries)
+
+    def _drain_and_close(self):
+        from django.db import connection
+        try:
+            self._drain()
+        finally:
+            # Connections are per thread, only threads of the handler get here.
+            connection.close()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._closed and len(self._queue) < self.batch_size:
+                    self._condition.wait(self.flush_interval)
+                closed = self._closed
+            if closed:
+                self._drain_and_close()
+                return
+            self._drain()
+
+    def flush(self):
+        with self._condition:
+            self._condition.notify()
+
+    def close(self):
+        """
+        Saves pending records. Called on interpreter exit by logging.shutdown.
+
+        Records left by a background thread that did not finish in time, or that belongs to the parent of a forked
+        process, are saved by a thread of their own, never with the connection of the caller.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread if self._pid == os.getpid() else None
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(10)
+        with self._condition:
+            pending = bool(self._queue or self._unreported_dropped)
+        if pending:
+            drain = threading.Thread(target=self._drain_and_close, name='district-euro-db-logging-close')
+            drain.daemon = True
+            drain.start()
+            drain.join(10)
+        logging.Handler.close(self)
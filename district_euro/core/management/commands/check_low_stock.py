@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from core.stock import check_low_stock, send_low_stock_digests
+
+
+class Command(BaseCommand):
+    help = ('Opens and resolves low stock alerts of the product units whose quantity changed since the last run. '
+            'Meant to be run periodically.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, dest='batch_size', default=1000,
+                            help='Max changed units checked per query.')
+        parser.add_argument('--digest', action='store_true', dest='digest', default=False,
+                            help='Queue an email to each vendor with its new alerts.')
+
+    def handle(self, *args, **options):
+        verbosity = int(options['verbosity'])
+        opened, resolved = check_low_stock(options['batch_size'])
+        if verbosity > 0:
+            self.stdout.write("Opened %d low stock alerts, resolved %d\n" % (opened, resolved))
+        if options['digest']:
+            queued = send_low_stock_digests()
+            if verbosity > 0:
+                self.stdout.write("Queued %d low stock digests\n" % queued)
@@ -0,0 +1,42 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core import models
+
+
+class Command(BaseCommand):
+    help = ('Deletes system logs older than the retention period in small batches, so the table is never locked '
+            'for long. Meant to be run periodically.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, dest='days', default=settings.SYSTEM_LOG_RETENTION_DAYS,
+                            help='Delete logs older than this amount of days.')
+        parser.add_argument('--batch-size', type=int, dest='batch_size', default=5000,
+                            help='Max logs deleted by every statement.')
+        parser.add_argument('--sleep', type=float, dest='sleep', default=0,
+                            help='Seconds to wait between batches.')
+
+    def handle(self, *args, **options):
+        verbosity = int(options['verbosity'])
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        # Expired logs are the oldest ones, walking them by id every batch stops right after the first rows.
+        expired = models.SystemLog.objects.filter(create_date__lt=cutoff).order_by('id')
+
+        deleted = 0
+        while True:
+            ids = list(expired.values_list('id', flat=True)[:options['batch_size']])
+            if not ids:
+                break
+            models.SystemLog.objects.filter(id__in=ids).delete()
+            deleted += len(ids)
+            if len(ids) < options['batch_size']:
+                break
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        if verbosity > 0:
+            self.stdout.write("Deleted %d system logs older than %s\n" % (deleted, cutoff.date()))
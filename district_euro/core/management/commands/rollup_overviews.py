@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from core.overview import rollup_overviews, rebuild_overviews
+
+
+class Command(BaseCommand):
+    help = ('Aggregates orders and sample dispatches created since the last run into the stores monthly period '
+            'overviews. Meant to be run periodically.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rebuild', action='store_true', dest='rebuild', default=False,
+                            help='Delete generated overviews and aggregate all the history again.')
+
+    def handle(self, *args, **options):
+        verbosity = int(options['verbosity'])
+        if options['rebuild']:
+            applied = rebuild_overviews()
+        else:
+            applied = rollup_overviews()
+        if verbosity > 0:
+            self.stdout.write("Updated %d period overviews\n" % applied)
@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.email import send_queued_emails
+from core.email.logic import MAX_ATTEMPTS
+
+
+class Command(BaseCommand):
+    help = ('Sends the queued emails that are due. Runs once unless --interval is given, then keeps polling the '
+            'queue as a worker.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, dest='batch_size', default=50,
+                            help='Max emails sent through one mail server connection.')
+        parser.add_argument('--max-attempts', type=int, dest='max_attempts', default=MAX_ATTEMPTS,
+                            help='Attempts before an email is marked as failed.')
+        parser.add_argument('--interval', type=float, dest='interval', default=0,
+                            help='Seconds to wait for new emails once the queue is empty.')
+
+    def handle(self, *args, **options):
+        verbosity = int(options['verbosity'])
+        while True:
+            sent, failed = send_queued_emails(options['batch_size'], options['max_attempts'])
+            if verbosity > 0 and (sent or failed):
+                self.stdout.write("Sent %d emails, %d failed\n" % (sent, failed))
+            if sent + failed < options['batch_size']:
+                if not options['interval']:
+                    break
+                time.sleep(options['interval'])
@@ -0,0 +1,43 @@
+from modeltranslation.utils import defer_translations, set_translations_deferred
+
+
+def _deferred_stream(content):
+    """
+    Generates the chunks of a streaming response with translations deferred, the state is not kept between chunks.
+    """
+    iterator = iter(content)
+    while True:
+        with defer_translations():
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                return
+        yield chunk
+
+
+class DeferTranslationsMiddleware(object):
+    """
+    Api responses render a single language, translations of other languages are not loaded from the database
+    unless they are read, see ``MultilingualQuerySet.defer_translations``.
+
+    Streaming responses are generated after the middleware is done, their chunks are deferred one by one.
+    """
+    prefix = '/api/'
+
+    def process_request(self, request):
+        # A previous request of this thread may not have reached process_response.
+        set_translations_deferred(None)
+        if request.path.startswith(self.prefix):
+            request._defer_translations = True
+            set_translations_deferred(True)
+
+    def process_exception(self, request, exception):
+        set_translations_deferred(None)
+
+    def process_response(self, request, response):
+        if getattr(request, '_defer_translations', False):
+            del request._defer_translations
+            set_translations_deferred(None)
+            if response.streaming:
+                response.streaming_content = _deferred_stream(response.streaming_content)
+        return response
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10.3 on 2026-10-19 15:56
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0067_image_object_id2'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OverviewWatermark',
+            fields=[
+                ('name', models.SlugField(max_length=255, primary_key=True, serialize=False, verbose_name='Source')),
+                ('last_id', models.BigIntegerField(default=0, verbose_name='Last processed id')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Last Updated')),
+            ],
+            options={
+                'verbose_name': 'Overview Watermark',
+                'verbose_name_plural': 'Overview Watermarks',
+            },
+        ),
+    ]
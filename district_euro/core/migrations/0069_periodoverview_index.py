@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10.3 on 2026-10-19 15:58
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+def lowercase_overview_types(apps, schema_editor):
+    OverviewType = apps.get_model('core', 'OverviewType')
+    PeriodOverview = apps.get_model('core', 'PeriodOverview')
+    for overview_type in list(OverviewType.objects.all()):
+        name = overview_type.name.lower()
+        if name == overview_type.name:
+            continue
+        OverviewType.objects.get_or_create(name=name)
+        PeriodOverview.objects.filter(type_id=overview_type.name).update(type_id=name)
+        overview_type.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0068_overviewwatermark'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='overviewtype',
+            name='name',
+            field=models.SlugField(help_text='Saved in lowercase', max_length=255, primary_key=True, serialize=False, verbose_name='Analyics Nmae'),
+        ),
+        migrations.AlterIndexTogether(
+            name='periodoverview',
+            index_together=set([('store', 'type', 'date_to')]),
+        ),
+        migrations.RunPython(lowercase_overview_types, migrations.RunPython.noop),
+    ]
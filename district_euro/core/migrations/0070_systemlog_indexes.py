@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10.3 on 2026-10-19 16:04
+from __future__ import unicode_literals
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0069_periodoverview_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='systemlog',
+            name='create_date',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+        # Old free text values are kept as json strings, a plain cast would fail on them.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    'ALTER TABLE core_systemlog ALTER COLUMN extra TYPE jsonb USING to_jsonb(extra)',
+                    'ALTER TABLE core_systemlog ALTER COLUMN extra TYPE text USING extra::text',
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='systemlog',
+                    name='extra',
+                    field=django.contrib.postgres.fields.jsonb.JSONField(blank=True, null=True,
+                                                                         verbose_name='Extra'),
+                ),
+            ],
+        ),
+        migrations.AlterIndexTogether(
+            name='systemlog',
+            index_together=set([('level', 'create_date')]),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10.3 on 2026-10-19 16:55
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0071_outgoingemail'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='order',
+            index_together=set([('store', 'status', 'created')]),
+        ),
+        # Orders that are not delivered nor returned, a few per store however long the history is. Django can not
+        # declare partial indexes, the condition matches exclude(status__in=Order.COMPLETED).
+        migrations.RunSQL(
+            "CREATE INDEX core_order_open_store_id_created ON core_order (store_id, created) "
+            "WHERE NOT (status IN ('DLV', 'RET'))",
+            'DROP INDEX core_order_open_store_id_created',
+        ),
+    ]
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10.3 on 2026-10-19 17:02
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0072_order_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='productunit',
+            name='sku',
+            field=models.CharField(blank=True, db_index=True, max_length=255, null=True, verbose_name='SKU'),
+        ),
+        migrations.AlterIndexTogether(
+            name='productunit',
+            index_together=set([('product', 'quantity')]),
+        ),
+    ]
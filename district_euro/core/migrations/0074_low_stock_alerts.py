@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10.3 on 2026-10-19 17:06
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0073_productunit_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LowStockAlert',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantity', models.PositiveIntegerField(verbose_name='Quantity')),
+                ('threshold', models.PositiveIntegerField(verbose_name='Threshold')),
+                ('created', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Date created')),
+                ('resolved', models.DateTimeField(blank=True, null=True, verbose_name='Date resolved')),
+                ('notified', models.BooleanField(default=False, verbose_name='Sent in a digest')),
+                ('product_unit', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='low_stock_alerts', to='core.ProductUnit', verbose_name='Product Unit')),
+            ],
+            options={
+                'ordering': ('-created', '-id'),
+                'verbose_name': 'Low Stock Alert',
+                'verbose_name_plural': 'Low Stock Alerts',
+            },
+        ),
+        migrations.CreateModel(
+            name='StockChange',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Date created')),
+                ('product_unit', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.ProductUnit', verbose_name='Product Unit')),
+            ],
+            options={
+                'verbose_name': 'Stock Change',
+                'verbose_name_plural': 'Stock Changes',
+            },
+        ),
+        migrations.AddField(
+            model_name='store',
+            name='low_stock_threshold',
+            field=models.PositiveIntegerField(default=0, help_text='Units with this quantity or less are low on stock', verbose_name='Low stock threshold'),
+        ),
+        migrations.AddField(
+            model_name='lowstockalert',
+            name='store',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='low_stock_alerts', to='core.Store', verbose_name='Store'),
+        ),
+        migrations.AlterIndexTogether(
+            name='lowstockalert',
+            index_together=set([('store', 'resolved')]),
+        ),
+        # At most one open alert per unit, Django can not declare partial unique indexes.
+        migrations.RunSQL(
+            'CREATE UNIQUE INDEX core_lowstockalert_open_product_unit_id ON core_lowstockalert (product_unit_id) '
+            'WHERE resolved IS NULL',
+            'DROP INDEX core_lowstockalert_open_product_unit_id',
+        ),
+    ]
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10.3 on 2026-10-19 17:27
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0074_low_stock_alerts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='date_tokens_revoked',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='tokens revoked'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10.3 on 2026-10-19 17:33
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0075_user_date_tokens_revoked'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='store',
+            name='countries',
+            field=models.ManyToManyField(blank=True, help_text='Do not alter this directly, add or delete store location instead.', related_name='country_store', to='core.Country', verbose_name='Countries'),
+        ),
+    ]
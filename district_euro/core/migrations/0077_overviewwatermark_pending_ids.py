@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10.3 on 2026-10-19 17:33
+from __future__ import unicode_literals
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0076_store_countries_help_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='overviewwatermark',
+            name='pending_ids',
+            field=django.contrib.postgres.fields.jsonb.JSONField(blank=True, default=dict, verbose_name='Pending ids'),
+        ),
+    ]
@@ -4,9 +4,11 @@ from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseU
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.fields import JSONField, ArrayField
+from django.core.exceptions import ObjectDoesNotExist
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 from djmoney.models.fields import MoneyField
 
@@ -34,6 +36,9 @@ class ShippingStatusMixin(object):
 
     STATUS_DICT = {k: v for k, v in STATUS}
 
+    # Statuses after which nothing else happens to the shipment.
+    COMPLETED = (DELIVERED, RETURNED)
+
 
 class Image(models.Model):
     name = models.CharField(max_length=255, blank=True, null=True, verbose_name=_('Name'))
@@ -100,6 +105,16 @@ class Region(models.Model):
 
 
 class UserManager(BaseUserManager):
+    # Profiles read by permissions and views of every authenticated request.
+    profile_relations = ('consumer', 'employee__warehouse', 'vendor')
+
+    def get_by_natural_key(self, username):
+        """
+        Loads the user together with its profiles, used by login and by JWT authentication.
+        A missing profile is cached too, checking it later does not query.
+        """
+        return self.select_related(*self.profile_relations).get(**{self.model.USERNAME_FIELD: username})
+
     def create_user(self, email, first_name, last_name, password=None):
         """
         Creates and saves a User with the given email, date of
@@ -148,6 +163,8 @@ class User(AbstractBaseUser, PermissionsMixin):
     last_name = models.CharField(max_length=255, verbose_name=_('Last Name'))
     is_staff = models.BooleanField(_('staff status'), default=False)
     is_active = models.BooleanField(_('active'), default=settings.USERS_AUTO_ACTIVATE)
+    # Tokens issued until then are not trusted without loading the user, see core.rest.auth.authentication.
+    date_tokens_revoked = models.DateTimeField(_('tokens revoked'), null=True, blank=True, editable=False)
 
     image = models.ForeignKey(Image, verbose_name=_('Image'), blank=True, null=True)
 
@@ -157,6 +174,15 @@ class User(AbstractBaseUser, PermissionsMixin):
     def get_full_name(self):
         return (self.first_name + ' ' if len(self.first_name) > 0 else '') + self.last_name
 
+    def get_profile(self, profile_attr):
+        """
+        Returns the consumer, employee or vendor profile of this user, None if the user does not have it.
+        """
+        try:
+            return getattr(self, profile_attr)
+        except ObjectDoesNotExist:
+            return None
+
     @property
     def profiles(self):
         """
@@ -164,15 +190,8 @@ class User(AbstractBaseUser, PermissionsMixin):
         :return: list(str)
         """
         profile_opts = [('consumer', _('Consumer')), ('employee', _('Employee')), ('vendor', _('Vendor'))]
-        profiles = []
-        for profile_attr, profile_string in profile_opts:
-            try:
-                getattr(self, profile_attr)
-            except:
-                pass
-            else:
-                profiles.append(profile_string)
-        return profiles
+        return [profile_string for profile_attr, profile_string in profile_opts
+                if self.get_profile(profile_attr) is not None]
 
 
 class Consumer(models.Model):
@@ -201,10 +220,11 @@ class Vendor(models.Model):
     def __unicode__(self):
         return unicode(self.user)
 
-    @property
+    @cached_property
     def store(self):
         """
         This method asumes the vendor has up to one store.
+        The store is kept on the instance, the user of a request resolves it once for all its views and serializers.
         """
         return self.stores.first()
 
@@ -249,9 +269,19 @@ class Store(models.Model):
     extra_information = models.TextField(verbose_name=_('Extra information'), blank=True, null=True)
     information_images = GenericRelation(Image, content_type_field='object_type', object_id_field='object_id2' )
 
+    low_stock_threshold = models.PositiveIntegerField(default=0, verbose_name=_('Low stock threshold'),
+                                                      help_text=_('Units with this quantity or less are low on stock'))
+
     def __unicode__(self):
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super(Store, cls).from_db(db, field_names, values)
+        # Stock of all the units is checked again when the threshold changes, see core.signals.
+        instance._loaded_low_stock_threshold = instance.__dict__.get('low_stock_threshold')
+        return instance
+
 
 class StoreLocation(models.Model):
     store = models.ForeignKey(Store, verbose_name=_('Store'), related_name='store_location')
@@ -378,16 +408,25 @@ class AttributeValue(models.Model):
 
 class ProductUnit(models.Model):
     product = models.ForeignKey(Product, verbose_name=_('Product'), related_name='units')
-    sku = models.CharField(max_length=255, verbose_name=_('SKU'), blank=True, null=True)
+    sku = models.CharField(max_length=255, verbose_name=_('SKU'), blank=True, null=True, db_index=True)
     quantity = models.PositiveIntegerField(default=0)
     attributes = models.ManyToManyField(AttributeValue, verbose_name=_('Product Attributes'), blank=True)
 
     def __unicode__(self):
         return u'%s (x%d)' % (unicode(self.product), self.quantity)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super(ProductUnit, cls).from_db(db, field_names, values)
+        # Saves that change the quantity are added to the stock change log, see core.signals.
+        instance._loaded_quantity = instance.__dict__.get('quantity')
+        return instance
+
     class Meta:
         verbose_name = _('Product Units')
         verbose_name_plural = _('Products Units')
+        # Units of the products of a store by stock, for sorting and filtering the inventory by quantity.
+        index_together = (('product', 'quantity'),)
 
 
 class Warehouse(models.Model):
@@ -423,18 +462,54 @@ class Showroom(models.Model):
 class SystemLog(models.Model):
     level = models.CharField(max_length=255, verbose_name=_('Level'))
     message = models.TextField(verbose_name=_('Message'))
-    extra = models.TextField(verbose_name=_('Message'), blank=True, null=True)
-    create_date = models.DateTimeField(auto_now_add=True)
+    extra = JSONField(verbose_name=_('Extra'), blank=True, null=True)
+    create_date = models.DateTimeField(default=timezone.now, db_index=True)
 
     class Meta:
         verbose_name = _('Log')
         verbose_name_plural = _('Logs')
         ordering = ('-id',)
+        index_together = (('level', 'create_date'),)
 
     def __unicode__(self):
         return '%s: %s' % (self.level, self.message)
 
 
+class OutgoingEmail(models.Model):
+    """
+    Email waiting to be sent by the send_queued_emails command.
+    """
+    PENDING = 'pending'
+    SENT = 'sent'
+    FAILED = 'failed'
+    STATUS = (
+        (PENDING, _('Pending')),
+        (SENT, _('Sent')),
+        (FAILED, _('Failed')),
+    )
+
+    subject = models.CharField(max_length=255, verbose_name=_('Subject'))
+    body = models.TextField(verbose_name=_('Body'))
+    html_body = models.TextField(blank=True, null=True, verbose_name=_('HTML Body'))
+    from_email = models.CharField(max_length=255, verbose_name=_('From'))
+    recipients = ArrayField(models.CharField(max_length=255), verbose_name=_('Recipients'))
+    status = models.CharField(max_length=20, choices=STATUS, default=PENDING, verbose_name=_('Status'))
+    attempts = models.PositiveIntegerField(default=0, verbose_name=_('Attempts'))
+    next_attempt = models.DateTimeField(default=timezone.now, verbose_name=_('Next Attempt'))
+    last_error = models.TextField(blank=True, verbose_name=_('Last Error'))
+    created = models.DateTimeField(default=timezone.now, verbose_name=_('Date created'))
+    sent = models.DateTimeField(blank=True, null=True, verbose_name=_('Date sent'))
+
+    class Meta:
+        verbose_name = _('Outgoing Email')
+        verbose_name_plural = _('Outgoing Emails')
+        ordering = ('-id',)
+        index_together = (('status', 'next_attempt'),)
+
+    def __unicode__(self):
+        return u'%s -> %s' % (self.subject, ', '.join(self.recipients))
+
+
 class Order(models.Model, ShippingStatusMixin):
     consumer = models.ForeignKey(Consumer, verbose_name=_('Consumer'))
     store = models.ForeignKey(Store, verbose_name=_('Store'))
@@ -446,6 +521,11 @@ class Order(models.Model, ShippingStatusMixin):
     status = models.CharField(max_length=100, choices=ShippingStatusMixin.STATUS, default=ShippingStatusMixin.PENDING)
     total_quantity = models.PositiveIntegerField(verbose_name=_('Total Products Quantity'))
 
+    class Meta:
+        # Completed orders of a store by status and date. Orders that are not completed have their own partial
+        # index, see migration 0072, so listing them does not read the order history.
+        index_together = (('store', 'status', 'created'),)
+
     def __unicode__(self):
         return u'%s %s' % (unicode(self.consumer), self.pk)
 
@@ -513,11 +593,17 @@ class ProductSampleUnits(models.Model):
 
 
 class OverviewType(models.Model):
-    name = models.SlugField(max_length=255, verbose_name=_('Analyics Nmae'), primary_key=True)
+    name = models.SlugField(max_length=255, verbose_name=_('Analyics Nmae'), primary_key=True,
+                            help_text=_('Saved in lowercase'))
 
     def __unicode__(self):
         return self.name
 
+    def save(self, force_insert=False, force_update=False, using=None, update_fields=None):
+        # Names are looked up by exact match, keep them normalized.
+        self.name = self.name.lower()
+        super(OverviewType, self).save(force_insert, force_update, using, update_fields)
+
     class Meta:
         verbose_name = _('Overview Type')
         verbose_name_plural = _('Overview Types')
@@ -537,6 +623,60 @@ class PeriodOverview(models.Model):
     class Meta:
         verbose_name = _('Period Overview')
         verbose_name_plural = _('Period Overviews')
+        index_together = (('store', 'type', 'date_to'),)
+
+
+class OverviewWatermark(models.Model):
+    """
+    Last row of a source table already added to the period overviews.
+    """
+    name = models.SlugField(max_length=255, verbose_name=_('Source'), primary_key=True)
+    last_id = models.BigIntegerField(default=0, verbose_name=_('Last processed id'))
+    # Missing ids below last_id that may still show up, by id with the time they were first missed.
+    pending_ids = JSONField(default=dict, blank=True, verbose_name=_('Pending ids'))
+    updated = models.DateTimeField(auto_now=True, verbose_name=_('Last Updated'))
+
+    def __unicode__(self):
+        return u'%s: %d' % (self.name, self.last_id)
+
+    class Meta:
+        verbose_name = _('Overview Watermark')
+        verbose_name_plural = _('Overview Watermarks')
+
+
+class StockChange(models.Model):
+    """
+    Product unit whose quantity changed since the last low stock check.
+    """
+    product_unit = models.ForeignKey(ProductUnit, verbose_name=_('Product Unit'))
+    created = models.DateTimeField(default=timezone.now, verbose_name=_('Date created'))
+
+    class Meta:
+        verbose_name = _('Stock Change')
+        verbose_name_plural = _('Stock Changes')
+
+
+class LowStockAlert(models.Model):
+    """
+    Product unit whose quantity fell to the low stock threshold of its store. Resolved once its quantity is above the
+    threshold again, there is at most one open alert per unit.
+    """
+    product_unit = models.ForeignKey(ProductUnit, verbose_name=_('Product Unit'), related_name='low_stock_alerts')
+    store = models.ForeignKey(Store, verbose_name=_('Store'), related_name='low_stock_alerts')
+    quantity = models.PositiveIntegerField(verbose_name=_('Quantity'))
+    threshold = models.PositiveIntegerField(verbose_name=_('Threshold'))
+    created = models.DateTimeField(default=timezone.now, verbose_name=_('Date created'))
+    resolved = models.DateTimeField(blank=True, null=True, verbose_name=_('Date resolved'))
+    notified = models.BooleanField(default=False, verbose_name=_('Sent in a digest'))
+
+    def __unicode__(self):
+        return u'%s: %d <= %d' % (unicode(self.product_unit), self.quantity, self.threshold)
+
+    class Meta:
+        verbose_name = _('Low Stock Alert')
+        verbose_name_plural = _('Low Stock Alerts')
+        ordering = ('-created', '-id')
+        index_together = (('store', 'resolved'),)
 
 
 class Sample(models.Model):
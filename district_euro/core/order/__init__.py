@@ -0,0 +1 @@
+from .logic import place_order
\ No newline at end of file
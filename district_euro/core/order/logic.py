@@ -0,0 +1,144 @@
+from collections import OrderedDict
+
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, When
+from django.utils.translation import ugettext as _
+
+from core import models
+from core.exceptions import InvalidOrderError, NotEnoughStockError
+from core.stock import log_stock_changes
+
+
+def _merge_cart(items):
+    """
+    Groups cart lines by product unit adding up their quantities.
+
+    :type items: iterable of (int, int)
+    :param items: pairs of product unit id and quantity.
+
+    :rtype: OrderedDict
+    :return: quantity by product unit id, in the order they were first added.
+    """
+    cart = OrderedDict()
+    for product_unit_id, quantity in items:
+        if quantity <= 0:
+            raise InvalidOrderError(_('Quantity must be grater than zero'))
+        cart[product_unit_id] = cart.get(product_unit_id, 0) + quantity
+    if not cart:
+        raise InvalidOrderError(_('Order must have at least one item'))
+    return cart
+
+
+def _attributes_by_unit(unit_ids):
+    """
+    Snapshot of the attributes of all units in one query, with the same format OrderItemForm uses.
+    """
+    attributes = dict((pk, []) for pk in unit_ids)
+    through = models.ProductUnit.attributes.through.objects.filter(productunit_id__in=unit_ids) \
+        .select_related('attributevalue') \
+        .order_by('productunit_id', 'attributevalue__value')
+    for row in through:
+        value = row.attributevalue
+        attributes[row.productunit_id].append({value.attribute_name: value.value})
+    return attributes
+
+
+def _add_by_pk(field, amounts):
+    """
+    Builds a CASE expression that adds a different amount to field for every pk, so all rows are updated with a
+    single statement.
+
+    :type amounts: dict
+    :param amounts: amount to add (negative to subtract) by pk.
+    """
+    whens = [When(pk=pk, then=F(field) + amount) for pk, amount in amounts.iteritems()]
+    return Case(*whens, default=F(field), output_field=IntegerField())
+
+
+def place_order(consumer, shipping_address, items):
+    """
+    Creates an order with its items from a cart.
+
+    Product units are locked once, prices and attributes are copied into the order items, stock is decremented and
+    products sold quantity increased with one statement each.
+
+    :type consumer: models.Consumer
+    :param consumer: the consumer placing the order.
+
+    :type shipping_address: str
+    :param shipping_address: where to ship the order.
+
+    :type items: iterable of (int, int)
+    :param items: pairs of product unit id and quantity.
+
+    :rtype: models.Order
+    :return: the created order.
+    """
+    cart = _merge_cart(items)
+
+    with transaction.atomic():
+        # Lock ordered by pk so concurrent orders over the same units can not deadlock.
+        units = list(models.ProductUnit.objects.select_related('product')
+                     .filter(pk__in=list(cart.iterkeys()), product__is_active=True, product__is_approved=True)
+                     .order_by('pk')
+                     .select_for_update())
+        units_by_id = dict((unit.pk, unit) for unit in units)
+
+        missing = [pk for pk in cart.iterkeys() if pk not in units_by_id]
+        if missing:
+            raise InvalidOrderError(_('Product units not available: %s') % ', '.join(map(str, missing)))
+
+        store_ids = set(unit.product.store_id for unit in units)
+        if len(store_ids) > 1:
+            raise InvalidOrderError(_('All products in an order must belong to the same store'))
+
+        currencies = set(unit.product.price.currency for unit in units)
+        if len(currencies) > 1:
+            raise InvalidOrderError(_('All products in an order must have the same currency'))
+
+        for unit in units:
+            if unit.quantity < cart[unit.pk]:
+                raise NotEnoughStockError(_('Not enough stock of %s') % unicode(unit))
+
+        attributes = _attributes_by_unit(list(cart.iterkeys()))
+
+        order_items = []
+        sold_by_product = {}
+        for product_unit_id, quantity in cart.iteritems():
+            unit = units_by_id[product_unit_id]
+            product = unit.product
+            order_items.append(models.OrderItem(
+                product_unit=unit,
+                sku=unit.sku,
+                name=product.name,
+                description=product.description,
+                unit_price=product.price,
+                total_price=product.price * quantity,
+                quantity=quantity,
+                attributes=attributes[product_unit_id],
+            ))
+            sold_by_product[product.pk] = sold_by_product.get(product.pk, 0) + quantity
+
+        total_price = order_items[0].total_price
+        for item in order_items[1:]:
+            total_price += item.total_price
+
+        order = models.Order.objects.create(
+            consumer=consumer,
+            store_id=store_ids.pop(),
+            shipping_address=shipping_address,
+            total_price=total_price,
+            total_quantity=sum(cart.itervalues()),
+        )
+
+        for item in order_items:
+            item.order = order
+        models.OrderItem.objects.bulk_create(order_items)
+
+        models.ProductUnit.objects.filter(pk__in=list(cart.iterkeys())) \
+            .update(quantity=_add_by_pk('quantity', dict((pk, -q) for pk, q in cart.iteritems())))
+        log_stock_changes(cart.iterkeys())
+        models.Product.objects.filter(pk__in=list(sold_by_product.iterkeys())) \
+            .update(sold_quantity=_add_by_pk('sold_quantity', sold_by_product))
+
+    return order
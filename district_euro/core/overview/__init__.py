@@ -0,0 +1 @@
+from .logic import rollup_overviews, rebuild_overviews, revenue_type, OVERVIEW_TYPES, SALES, UNITS, REVENUE, SAMPLES
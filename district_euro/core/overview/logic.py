@@ -0,0 +1,170 @@
+import calendar
+import logging
+import time
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncMonth
+
+from core import models
+
+logger = logging.getLogger(__name__)
+
+# Overview types produced by the rollup. Orders count in the month they were placed whatever their status, returned
+# orders included: the rollup only sees each order once, when it is created, and never revisits later status changes.
+SALES = 'sales'  # Number of orders placed
+UNITS = 'units'  # Number of products units ordered
+REVENUE = 'revenue'  # Gross total price of orders placed, in cents, one type per currency, see revenue_type
+SAMPLES = 'samples'  # Number of samples dispatched
+
+OVERVIEW_TYPES = (SALES, UNITS, REVENUE, SAMPLES)
+
+# Seconds ids missing below the watermark are checked again, rows of transactions still open when the rollup ran show
+# up within them. Ids of rolled back or deleted rows are forgotten after them.
+GAP_TIMEOUT = 60 * 60
+
+
+def revenue_type(currency):
+    """
+    Returns the revenue overview type of currency, amounts in different currencies are not added together.
+    """
+    return '%s_%s' % (REVENUE, currency.lower())
+
+
+def _month_bounds(day):
+    """
+    Returns first and last day of the month day belongs to.
+    """
+    last_day = calendar.monthrange(day.year, day.month)[1]
+    return day.replace(day=1), day.replace(day=last_day)
+
+
+def _to_cents(amount):
+    amount = getattr(amount, 'amount', amount)
+    return int((amount * 100).to_integral_value()) if amount is not None else 0
+
+
+def _order_deltas(queryset):
+    rows = queryset.annotate(month=TruncMonth('created')) \
+        .values('store_id', 'month', 'total_price_currency') \
+        .annotate(orders=Count('id'), units=Sum('total_quantity'), revenue=Sum('total_price')) \
+        .order_by()
+    for row in rows:
+        month = row['month'].date()
+        yield row['store_id'], SALES, month, row['orders']
+        yield row['store_id'], UNITS, month, row['units'] or 0
+        yield row['store_id'], revenue_type(row['total_price_currency']), month, _to_cents(row['revenue'])
+
+
+def _sample_dispatch_deltas(queryset):
+    rows = queryset.annotate(month=TruncMonth('created')) \
+        .values('store_id', 'month') \
+        .annotate(dispatches=Count('id')) \
+        .order_by()
+    for row in rows:
+        yield row['store_id'], SAMPLES, row['month'].date(), row['dispatches']
+
+
+# (watermark name, source model, deltas generator)
+_SOURCES = (
+    ('order', models.Order, _order_deltas),
+    ('sampledispatch', models.SampleDispatch, _sample_dispatch_deltas),
+)
+
+
+def _ensure_overview_types(names):
+    existing = set(models.OverviewType.objects.filter(name__in=names).values_list('name', flat=True))
+    models.OverviewType.objects.bulk_create(
+        [models.OverviewType(name=name) for name in names if name not in existing])
+
+
+def _missing_ids(model, last_id, upper_id):
+    """
+    Returns the ids after last_id up to upper_id without a visible row.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT s.id FROM generate_series(%s, %s) AS s(id) '
+            'LEFT JOIN {table} t ON t.{pk} = s.id WHERE t.{pk} IS NULL'.format(
+                table=connection.ops.quote_name(model._meta.db_table),
+                pk=connection.ops.quote_name(model._meta.pk.column)),
+            [last_id + 1, upper_id])
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _apply_delta(store_id, type_name, day, delta):
+    """
+    Adds delta to the period day belongs to and to the running total of that period and all the following ones.
+    """
+    date_from, date_to = _month_bounds(day)
+    periods = models.PeriodOverview.objects.filter(store_id=store_id, type_id=type_name)
+
+    updated = periods.filter(date_from=date_from) \
+        .update(value=F('value') + delta, aggregate_value=F('aggregate_value') + delta)
+    if not updated:
+        previous_aggregate = periods.filter(date_to__lt=date_from).order_by('-date_to') \
+            .values_list('aggregate_value', flat=True).first()
+        models.PeriodOverview.objects.create(store_id=store_id, type_id=type_name, date_from=date_from,
+                                             date_to=date_to, value=delta,
+                                             aggregate_value=(previous_aggregate or 0) + delta)
+
+    # Only late data for past periods touches following periods.
+    periods.filter(date_from__gt=date_from).update(aggregate_value=F('aggregate_value') + delta)
+
+
+def rollup_overviews():
+    """
+    Adds orders and sample dispatches created since the last run to the stores monthly period overviews.
+
+    Rows are tracked by id with a watermark per source table, so each run only aggregates new rows. Ids below the
+    watermark without a visible row, like the ones of transactions that had not committed yet, are kept as pending
+    and added once their rows show up, for GAP_TIMEOUT seconds. Watermarks are locked while running, concurrent runs
+    wait for each other instead of counting rows twice.
+
+    Sales, units and revenue are gross amounts of placed orders, orders returned afterwards are not subtracted.
+
+    :rtype: int
+    :return: amount of period overviews updated or created.
+    """
+    applied = 0
+    now = int(time.time())
+    with transaction.atomic():
+        for name, model, deltas in _SOURCES:
+            watermark, _ = models.OverviewWatermark.objects.select_for_update().get_or_create(name=name)
+            upper_id = model.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+            pending = dict((int(pk), seen) for pk, seen in watermark.pending_ids.items())
+            if upper_id <= watermark.last_id and not pending:
+                continue
+
+            filled = set(model.objects.filter(pk__in=list(pending)).values_list('pk', flat=True)) if pending else set()
+            queryset = model.objects.filter(Q(pk__gt=watermark.last_id, pk__lte=upper_id) | Q(pk__in=list(filled)))
+            rows = [row for row in deltas(queryset) if row[3]]
+            _ensure_overview_types(set(row[1] for row in rows))
+            for store_id, type_name, day, delta in rows:
+                _apply_delta(store_id, type_name, day, delta)
+                applied += 1
+
+            pending = dict((pk, seen) for pk, seen in pending.items() if pk not in filled and now - seen < GAP_TIMEOUT)
+            if upper_id > watermark.last_id:
+                pending.update((pk, now) for pk in _missing_ids(model, watermark.last_id, upper_id))
+                logger.info('Overviews rollup of %s from id %d to %d', name, watermark.last_id, upper_id)
+                watermark.last_id = upper_id
+            if filled:
+                logger.info('Overviews rollup of %s added %d late rows', name, len(filled))
+            watermark.pending_ids = dict((str(pk), seen) for pk, seen in pending.items())
+            watermark.save()
+    return applied
+
+
+def rebuild_overviews():
+    """
+    Deletes the overviews generated by the rollup and aggregates all the history again.
+
+    :rtype: int
+    :return: amount of period overviews created.
+    """
+    with transaction.atomic():
+        models.PeriodOverview.objects.filter(Q(type_id__in=OVERVIEW_TYPES) | Q(type__name__startswith=REVENUE + '_')) \
+            .delete()
+        models.OverviewWatermark.objects.filter(name__in=[s[0] for s in _SOURCES]).update(last_id=0, pending_ids={})
+        return rollup_overviews()
@@ -1,5 +1,9 @@
 from collections import OrderedDict
 
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models.sql.datastructures import EmptyResultSet
+from django.utils.functional import cached_property
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
@@ -15,6 +19,71 @@ class PageNumberPagination2(PageNumberPagination):
         ]))
 
 
+class Projection(object):
+    """
+    Paginable queryset whose pages are projected to dictionaries, for instance with values() and annotations.
+
+    Counting a projection with annotations counts a subquery with all its joins, and offsets project every skipped
+    row. Here the plain queryset is counted, the primary keys of the page are found on the plain queryset too and
+    only the rows of the page are projected. Projected rows must include the primary key.
+    """
+
+    def __init__(self, queryset, project):
+        self.queryset = queryset
+        self.project = project
+
+    def count(self):
+        return self.queryset.count()
+
+    def __len__(self):
+        return self.count()
+
+    def __iter__(self):
+        return iter(self.project(self.queryset))
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice):
+            return self[key:key + 1][0]
+        pks = list(self.queryset[key].values_list('pk', flat=True))
+        pk_name = self.queryset.model._meta.pk.attname
+        positions = {pk: position for position, pk in enumerate(pks)}
+        rows = self.project(self.queryset.model._default_manager.filter(pk__in=pks))
+        return sorted(rows, key=lambda row: positions[row[pk_name]])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that estimates the row count of big querysets instead of counting every row. Unfiltered querysets take
+    the row count of the table from the Postgres statistics, filtered ones the row estimate of the query plan. Both are
+    as fresh as the last analyze of the tables, querysets estimated under exact_below rows are counted exactly.
+    """
+    # Querysets estimated under this amount of rows are counted exactly.
+    exact_below = 100000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        estimate = self.estimate(queryset)
+        if estimate is not None and estimate >= self.exact_below:
+            return estimate
+        return queryset.count()
+
+    @staticmethod
+    def estimate(queryset):
+        with connections[queryset.db].cursor() as cursor:
+            if not queryset.query.where:
+                cursor.execute('SELECT reltuples FROM pg_class WHERE relname = %s', [queryset.model._meta.db_table])
+                row = cursor.fetchone()
+                return None if row is None else int(row[0])
+            try:
+                sql, params = queryset.order_by().query.get_compiler(queryset.db).as_sql()
+            except EmptyResultSet:
+                return 0
+            cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+            plan = cursor.fetchone()[0]
+        return int(plan[0]['Plan']['Plan Rows'])
+
+
 def paginated_by(*args, **kwargs):
     new_page_size = kwargs.pop('page_size', 100)
 
@@ -3,17 +3,17 @@ from rest_framework import permissions
 
 class ConsumerPermission(permissions.IsAuthenticated):
     def has_permission(self, request, view):
-        if super(ConsumerPermission, self).has_permission(request, view) and request.user.consumer is not None:
-            return True
+        return super(ConsumerPermission, self).has_permission(request, view) and \
+            request.user.get_profile('consumer') is not None
 
 
 class VendorPermission(permissions.IsAuthenticated):
     def has_permission(self, request, view):
-        if super(VendorPermission, self).has_permission(request, view) and request.user.vendor is not None:
-            return True
+        return super(VendorPermission, self).has_permission(request, view) and \
+            request.user.get_profile('vendor') is not None
 
 
 class EmployeePermission(permissions.IsAuthenticated):
     def has_permission(self, request, view):
-        if super(EmployeePermission, self).has_permission(request, view) and request.user.employee is not None:
-            return True
+        return super(EmployeePermission, self).has_permission(request, view) and \
+            request.user.get_profile('employee') is not None
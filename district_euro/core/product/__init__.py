@@ -1 +1 @@
-from .logic import bulk_product_upload
\ No newline at end of file
+from .logic import approve_products, bulk_product_upload, products_approved
@@ -1,11 +1,19 @@
 import logging
 
+from django.db import transaction
+from django.dispatch import Signal
+from django.utils import timezone
 from openpyxl import load_workbook
 
+from core import models
 from .bulk_upload import process_product_row, is_sheet_valid
 
 logger = logging.getLogger(__name__)
 
+# Sent once per approve_products batch after it is committed, for work that must follow approvals, like invalidating
+# caches of the approved products or of their stores.
+products_approved = Signal(providing_args=['product_ids', 'store_ids'])
+
 
 def bulk_product_upload(file, user):
     """
@@ -47,3 +55,28 @@ def bulk_product_upload(file, user):
 
         products_by_sheet[sheet] = current_sheet
     return products_by_sheet
+
+
+def approve_products(queryset):
+    """
+    Approves the products of queryset that are not approved yet with a single update, instead of saving them one by
+    one. products_approved is sent once for all of them.
+
+    :type queryset: QuerySet
+    :param queryset: products to approve, for instance the ones of a store.
+
+    :rtype: int
+    :return: amount of products approved.
+    """
+    with transaction.atomic():
+        rows = list(queryset.filter(is_approved=False).order_by().select_for_update()
+                    .values_list('pk', 'store_id'))
+        if not rows:
+            return 0
+        product_ids = [pk for pk, _ in rows]
+        store_ids = set(store_id for _, store_id in rows)
+        models.Product.objects.filter(pk__in=product_ids).update(is_approved=True, date_approved=timezone.now())
+        transaction.on_commit(
+            lambda: products_approved.send(sender=models.Product, product_ids=product_ids, store_ids=store_ids))
+    logger.info('Approved %d products of stores %s', len(product_ids), ', '.join(map(str, sorted(store_ids))))
+    return len(product_ids)
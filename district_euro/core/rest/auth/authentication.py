@@ -0,0 +1,107 @@
+from calendar import timegm
+
+from django.utils import timezone
+from rest_framework import permissions
+from rest_framework_jwt import authentication
+
+from core import models
+
+# Fields of the user read on every read only request, the rest are loaded when accessed.
+USER_FIELDS = ('email', 'is_active', 'is_staff', 'is_superuser', 'date_tokens_revoked')
+
+
+def revoke_tokens(user_id):
+    """
+    Tokens of the user issued until now are verified against the database until they expire.
+    """
+    models.User.objects.filter(pk=user_id).update(date_tokens_revoked=timezone.now())
+
+
+def tokens_revoked(user, issued_at):
+    revoked = user.date_tokens_revoked
+    return revoked is not None and (issued_at is None or issued_at <= timegm(revoked.utctimetuple()))
+
+
+def _deferred(model, db, **values):
+    """
+    Returns an instance of model with the given field values, other fields are loaded from db when accessed.
+    """
+    field_names = [field.attname for field in model._meta.concrete_fields if field.attname in values]
+    return model.from_db(db, field_names, [values[name] for name in field_names])
+
+
+def profile_claims(user):
+    """
+    Profiles of the user with the ids views filter by, included in the token payload.
+    """
+    claims = {}
+    if user.get_profile('consumer') is not None:
+        claims['consumer'] = {}
+    vendor = user.get_profile('vendor')
+    if vendor is not None:
+        claims['vendor'] = {'store_id': vendor.store.pk if vendor.store else None}
+    employee = user.get_profile('employee')
+    if employee is not None:
+        claims['employee'] = {'warehouse_id': employee.warehouse_id, 'showroom_id': employee.showroom_id}
+    return claims
+
+
+def user_from_payload(payload):
+    """
+    Builds the user of a token from its claims, reading only the user row.
+    Returns None for tokens without profile claims, missing or inactive users and revoked tokens.
+
+    Profiles, store and warehouse only carry their ids, enough to filter by them. Their other fields are loaded from
+    the database when accessed.
+    """
+    claims = payload.get('profiles')
+    user_id = payload.get('user_id')
+    if claims is None or user_id is None:
+        return None
+    user = models.User.objects.only(*USER_FIELDS).filter(pk=user_id).first()
+    if user is None or not user.is_active or tokens_revoked(user, payload.get('iat')):
+        return None
+
+    db = user._state.db
+    profiles = {'consumer': None, 'vendor': None, 'employee': None}
+    if 'consumer' in claims:
+        profiles['consumer'] = _deferred(models.Consumer, db, user_id=user.pk)
+    if 'vendor' in claims:
+        vendor = _deferred(models.Vendor, db, user_id=user.pk)
+        store_id = claims['vendor'].get('store_id')
+        vendor.store = None
+        if store_id is not None:
+            vendor.store = _deferred(models.Store, db, id=store_id)
+            vendor.store.vendor = vendor
+        profiles['vendor'] = vendor
+    if 'employee' in claims:
+        employee = _deferred(models.Employee, db, user_id=user.pk, warehouse_id=claims['employee']['warehouse_id'],
+                             showroom_id=claims['employee']['showroom_id'])
+        employee.warehouse = _deferred(models.Warehouse, db, id=employee.warehouse_id)
+        profiles['employee'] = employee
+    for name, profile in profiles.items():
+        if profile is not None:
+            profile.user = user
+        # A cached None is read as a missing profile, same as select_related leaves it.
+        setattr(user, models.User._meta.get_field(name).get_cache_name(), profile)
+    return user
+
+
+class JSONWebTokenAuthentication(authentication.JSONWebTokenAuthentication):
+    """
+    JWT authentication that trusts the token profile claims for read only requests.
+
+    Safe methods get the user row and build its profiles from the claims, other methods and users with revoked tokens
+    load the user and its profiles from the database.
+    """
+
+    def authenticate(self, request):
+        self.read_only = request.method in permissions.SAFE_METHODS
+        return super(JSONWebTokenAuthentication, self).authenticate(request)
+
+    def authenticate_credentials(self, payload):
+        if self.read_only:
+            user = user_from_payload(payload)
+            if user is not None:
+                return user
+        return super(JSONWebTokenAuthentication, self).authenticate_credentials(payload)
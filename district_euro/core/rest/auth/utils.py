@@ -1,9 +1,24 @@
+from calendar import timegm
+from datetime import datetime
+
 from django.utils import timezone
 from rest_framework_jwt.serializers import api_settings as jwt_settings
+from rest_framework_jwt.utils import jwt_payload_handler as default_jwt_payload_handler
 
+from .authentication import profile_claims
 from .serializers import UserLoginSerializer
 
 
+def jwt_payload_handler(user):
+    """
+    Adds the issue time and the user profiles to the token, read only requests authenticate with them.
+    """
+    payload = default_jwt_payload_handler(user)
+    payload['iat'] = timegm(datetime.utcnow().utctimetuple())
+    payload['profiles'] = profile_claims(user)
+    return payload
+
+
 def jwt_response_payload_handler(token, user=None, request=None):
     """
     Returns the response data for both the login and refresh views.
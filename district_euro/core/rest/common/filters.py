@@ -1,4 +1,5 @@
 import django_filters
+from django.db.models import Q
 from django.contrib.postgres.search import SearchQuery, SearchVector, SearchRank
 from django.utils.translation import get_language
 from rest_framework import filters
@@ -68,6 +69,22 @@ class ProductFilter(filters.FilterSet):
         return queryset.annotate(rank=SearchRank(vector, query)).filter(rank__gt=0.1).order_by('-rank')
 
 
+class InventoryFilter(filters.FilterSet):
+    """
+    Filters product units annotated with product_name.
+    """
+    search = django_filters.MethodFilter(action='do_search')
+    max_quantity = django_filters.NumberFilter(name='quantity', lookup_type='lte')
+
+    class Meta:
+        model = models.ProductUnit
+        fields = ('search', 'max_quantity')
+
+    def do_search(self, queryset, value):
+        # SKUs are codes, matching their start keeps to the sku index.
+        return queryset.filter(Q(sku__startswith=value) | Q(product_name__icontains=value))
+
+
 class SampleDispatchFilter(filters.FilterSet):
     store = django_filters.MethodFilter(action='filter_store')
     tracking_number = django_filters.CharFilter(lookup_type="icontains")
@@ -1,3 +1,6 @@
+from django.db.models import Case, CharField, Value, When
+from django.db.models.functions import Concat
+from djmoney.models.fields import MoneyPatched
 from rest_framework import serializers
 
 from core import models
@@ -43,6 +46,44 @@ class OrderSerializer(serializers.ModelSerializer):
         return "%05d" % obj.id
 
 
+class OrderListSerializer(serializers.Serializer):
+    """
+    Same output as OrderSerializer, read from the rows of project() instead of orders, so listing orders does not
+    load orders, consumers nor users.
+    """
+    id = serializers.SerializerMethodField()
+    total_price = serializers.SerializerMethodField()
+    tracking_number = serializers.CharField()
+    created = serializers.DateTimeField()
+    shipping_address = serializers.CharField()
+    status = serializers.SerializerMethodField()
+    status_id = serializers.CharField(source='status')
+    total_quantity = serializers.IntegerField()
+    consumer_full_name = serializers.CharField()
+
+    # User.get_full_name in SQL.
+    consumer_full_name_expression = Concat(
+        Case(When(consumer__user__first_name='', then=Value('')),
+             default=Concat('consumer__user__first_name', Value(' ')), output_field=CharField()),
+        'consumer__user__last_name')
+
+    @classmethod
+    def project(cls, queryset):
+        return queryset.annotate(consumer_full_name=cls.consumer_full_name_expression) \
+            .values('id', 'total_price', 'total_price_currency', 'tracking_number', 'created', 'shipping_address',
+                    'status', 'total_quantity', 'consumer_full_name')
+
+    def get_id(self, row):
+        return "%05d" % row['id']
+
+    def get_total_price(self, row):
+        # Money of model instances, formatted for the active language.
+        return unicode(MoneyPatched(row['total_price'], row['total_price_currency']))
+
+    def get_status(self, row):
+        return models.Order.STATUS_DICT.get(row['status'])
+
+
 class OrderItemSerializer(serializers.ModelSerializer):
     total_price = serializers.CharField()
     unit_price = serializers.CharField()
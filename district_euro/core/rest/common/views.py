@@ -15,15 +15,15 @@ from rest_framework.viewsets import GenericViewSet
 
 from core import models, permissions, image as image_logic
 from core import throttling
-from core.pagination import paginated_by
-from core.utils.mixins import UserViewMixin
+from core.pagination import Projection, paginated_by
+from core.utils.mixins import CompiledListMixin, UserViewMixin
 from .filters import OrderFilter, ProductFilter, SampleDispatchFilter
-from .serializers import OrderSerializer, OrderDetailSerializer, ProductDetailSerializer, ProductSerializer, \
+from .serializers import OrderListSerializer, OrderDetailSerializer, ProductDetailSerializer, ProductSerializer, \
     ProductSampleSerializer, SampleSerializer, AttributeDetailSerailzer, SampleDispatchSerializer, ShowroomSerializer, \
     ShowroomDetailSerializer
 
 
-class AbstractOrderView(GenericViewSet, RetrieveModelMixin, ListModelMixin, UserViewMixin):
+class AbstractOrderView(CompiledListMixin, GenericViewSet, RetrieveModelMixin, ListModelMixin, UserViewMixin):
     pagination_class = paginated_by(page_size=10)
     filter_backends = (DjangoFilterBackend,)
     filter_class = OrderFilter
@@ -34,7 +34,7 @@ class AbstractOrderView(GenericViewSet, RetrieveModelMixin, ListModelMixin, User
     def get_serializer_class(self):
         if self.action == 'retrieve':
             return OrderDetailSerializer
-        return OrderSerializer
+        return OrderListSerializer
 
     def retrieve(self, request, *args, **kwargs):
         """
@@ -62,12 +62,20 @@ class AbstractOrderView(GenericViewSet, RetrieveModelMixin, ListModelMixin, User
               required: false
               paramType: query
 
-        response_serializer: core.rest.common.serializers.OrderSerializer
+        response_serializer: core.rest.common.serializers.OrderListSerializer
         """
-        return super(AbstractOrderView, self).list(request, *args, **kwargs)
+        queryset = Projection(self.filter_queryset(self.get_queryset()), OrderListSerializer.project)
 
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
 
-class AbstractProductViewSet(GenericViewSet, RetrieveModelMixin, ListModelMixin):
+        serializer = self.get_serializer(list(queryset), many=True)
+        return Response(serializer.data)
+
+
+class AbstractProductViewSet(CompiledListMixin, GenericViewSet, RetrieveModelMixin, ListModelMixin):
     """
     View for searching products, used by all users including anonymus.
     """
@@ -108,7 +116,7 @@ class AbstractProductViewSet(GenericViewSet, RetrieveModelMixin, ListModelMixin)
         return super(AbstractProductViewSet, self).list(request, *args, **kwargs)
 
 
-class AbstractProductSampleViewSet(GenericViewSet, ListModelMixin, RetrieveModelMixin):
+class AbstractProductSampleViewSet(CompiledListMixin, GenericViewSet, ListModelMixin, RetrieveModelMixin):
     pagination_class = paginated_by(page_size=10)
 
     def get_queryset(self):
@@ -406,7 +414,7 @@ class AbstractSampleDispatchViewSet(GenericViewSet, ListModelMixin, RetrieveMode
         return super(AbstractSampleDispatchViewSet, self).list(request, *args, **kwargs)
 
 
-class ShowroomViewSet(GenericViewSet, RetrieveModelMixin, ListModelMixin):
+class ShowroomViewSet(CompiledListMixin, GenericViewSet, RetrieveModelMixin, ListModelMixin):
     permission_classes = ()
     pagination_class = paginated_by(page_size=10)
 
@@ -0,0 +1,19 @@
+from rest_framework import serializers
+
+
+class CartItemSerializer(serializers.Serializer):
+    product_unit = serializers.IntegerField()
+    quantity = serializers.IntegerField(min_value=1)
+
+
+class OrderPlaceSerializer(serializers.Serializer):
+    """
+    Used to place an order. Product units are not validated here, place_order checks all of them at once.
+    """
+    shipping_address = serializers.CharField(max_length=255)
+    items = CartItemSerializer(many=True)
+
+    def validate_items(self, value):
+        if not value:
+            raise serializers.ValidationError('Order must have at least one item')
+        return value
@@ -0,0 +1,42 @@
+from django.db.models import Prefetch
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.viewsets import GenericViewSet
+
+from core import models, permissions
+from core.order import place_order
+from core.rest.common.serializers import OrderDetailSerializer
+from core.utils.mixins import UserViewMixin
+from .serializers import OrderPlaceSerializer
+
+
+class OrderViewSet(GenericViewSet, UserViewMixin):
+    permission_classes = (permissions.ConsumerPermission,)
+    serializer_class = OrderPlaceSerializer
+
+    def get_queryset(self):
+        return models.Order.objects.filter(consumer_id=self.get_user_id()) \
+            .select_related('consumer__user') \
+            .prefetch_related(Prefetch('order_items',
+                                       models.OrderItem.objects.select_related('product_unit__product__image')))
+
+    def create(self, request, *args, **kwargs):
+        """
+        Places an order with the products units in the cart.
+        ---
+        request_serializer: core.rest.consumer.serializers.OrderPlaceSerializer
+        response_serializer: core.rest.common.serializers.OrderDetailSerializer
+
+        responseMessages:
+            - code: 201
+              message: Order placed
+            - code: 400
+              message: Invalid cart or not enough stock
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        items = [(item['product_unit'], item['quantity']) for item in data['items']]
+        order = place_order(self.get_user().consumer, data['shipping_address'], items)
+        return Response(OrderDetailSerializer(self.get_queryset().get(pk=order.pk)).data,
+                        status=status.HTTP_201_CREATED)
@@ -1,6 +1,8 @@
+from django.db import transaction
 from rest_framework import serializers
 
 from core import models
+from core.email import send_mail_join_request
 from core.rest.common.serializers import ImageSerializer, ThinImageSerializer, StoreSerializer
 from landing import models as landing_models
 
@@ -97,8 +99,9 @@ class JoinRequestSerializer(serializers.ModelSerializer):
         exclude = ('created',)
 
     def create(self, validated_data):
-        obj = super(JoinRequestSerializer, self).create(validated_data)
-        # send_mail_join_request(obj)
+        with transaction.atomic():
+            obj = super(JoinRequestSerializer, self).create(validated_data)
+            send_mail_join_request(obj)
         return obj
 
 
@@ -112,3 +115,32 @@ class SignUpRequestSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         obj = super(SignUpRequestSerializer, self).create(validated_data)
         return obj
+
+
+class ProductApprovalSerializer(serializers.Serializer):
+    """
+    Unapproved products to approve at once, the ones matching all the given filters. Products created by a bulk upload
+    can be selected by store and creation dates.
+    """
+    store = serializers.PrimaryKeyRelatedField(queryset=models.Store.objects.all(), required=False)
+    products = serializers.ListField(child=serializers.IntegerField(), required=False)
+    date_from = serializers.DateTimeField(required=False)
+    date_to = serializers.DateTimeField(required=False)
+
+    def validate(self, attrs):
+        if not attrs:
+            raise serializers.ValidationError('store, products, date_from or date_to is required')
+        return attrs
+
+    def get_products(self):
+        data = self.validated_data
+        queryset = models.UnapprovedProduct.objects.all()
+        if 'store' in data:
+            queryset = queryset.filter(store=data['store'])
+        if 'products' in data:
+            queryset = queryset.filter(pk__in=data['products'])
+        if 'date_from' in data:
+            queryset = queryset.filter(date_created__gte=data['date_from'])
+        if 'date_to' in data:
+            queryset = queryset.filter(date_created__lte=data['date_to'])
+        return queryset
@@ -6,12 +6,14 @@ from rest_framework.decorators import detail_route
 from rest_framework.filters import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
 from rest_framework.mixins import ListModelMixin, RetrieveModelMixin, CreateModelMixin
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.viewsets import GenericViewSet
 
 from core import models, throttling
 from core.pagination import paginated_by
+from core.product import approve_products
 from core.rest.common import serializers as common_serializers
 from core.rest.common import views as common_views
 from core.rest.common.views import AbstractProductViewSet
@@ -19,7 +21,7 @@ from district_euro import settings
 from .filters import StoreFilter
 from .serializers import CategorySerializer, WarehouseSerializer, StoreSerializer, StoreDetailSerializer, \
     CountrySerializer, RegionSerializer, RegionDetailSerializer, CountryDetailSerializer, JoinRequestSerializer, \
-    SignUpRequestSerializer
+    SignUpRequestSerializer, ProductApprovalSerializer
 
 
 class ShippingStatusView(APIView):
@@ -41,6 +43,25 @@ class ShippingStatusView(APIView):
         return Response(payload)
 
 
+class ProductApprovalView(APIView):
+    permission_classes = (IsAdminUser,)
+
+    def post(self, request, *args, **kwargs):
+        """
+        Approves at once the unapproved products matching all the given filters. Only for staff.
+        ---
+        request_serializer: core.rest.other.serializers.ProductApprovalSerializer
+        type:
+            approved:
+                type: integer
+                required: true
+                description: amount of products approved
+        """
+        serializer = ProductApprovalSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return Response({'approved': approve_products(serializer.get_products())})
+
+
 class CurrencyListView(APIView):
     permission_classes = ()
 
@@ -283,7 +304,7 @@ class ShowroomViewSet(common_views.ShowroomViewSet):
 
 class JoinRequestViewSet(GenericViewSet, CreateModelMixin):
     permission_classes = ()
-    throttle_classes = (throttling.throttle_by('2/min', 'join-request'),)
+    throttle_classes = (throttling.throttle_by('2/min', 'join-request', base=throttling.SlidingWindowRateThrottle),)
     serializer_class = JoinRequestSerializer
 
     def create(self, request, *args, **kwargs):
@@ -301,7 +322,7 @@ class JoinRequestViewSet(GenericViewSet, CreateModelMixin):
 
 class SignUpRequestViewSet(GenericViewSet, CreateModelMixin):
     permission_classes = ()
-    throttle_classes = (throttling.throttle_by('2/min', 'join-request'),)
+    throttle_classes = (throttling.throttle_by('2/min', 'join-request', base=throttling.SlidingWindowRateThrottle),)
     serializer_class = SignUpRequestSerializer
 
     def create(self, request, *args, **kwargs):
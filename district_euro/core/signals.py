@@ -1,15 +1,60 @@
-from django.db.models.signals import pre_delete, post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from django.db import transaction
 from core import models
+from core.stock import log_stock_changes, log_store_stock
+from core.vendor import store_location_changed
+from core.rest.auth.authentication import revoke_tokens
 
 
-@receiver(pre_delete, sender=models.StoreLocation)
 @receiver(post_save, sender=models.StoreLocation)
-def store_location_modify_handler(sender, **kwargs):
-    instance = kwargs.get('instance', None)
-    if instance:
-        with transaction.atomic():
-            countries = models.Country.objects.filter(cities__regions__region_stores__store_id=instance.store.pk).distinct()
-            instance.store.countries.clear()
-            instance.store.countries.add(*countries)
+def store_location_save_handler(sender, instance, created, **kwargs):
+    store_location_changed(instance, created=created)
+
+
+@receiver(post_delete, sender=models.StoreLocation)
+def store_location_delete_handler(sender, instance, **kwargs):
+    store_location_changed(instance, deleted=True)
+
+
+@receiver(post_delete, sender=models.User)
+@receiver(post_save, sender=models.User)
+def user_modify_handler(sender, instance, **kwargs):
+    # New users and fixtures have no tokens yet.
+    if kwargs.get('created') or kwargs.get('raw'):
+        return
+    update_fields = kwargs.get('update_fields')
+    if update_fields is None or set(update_fields) != {'last_login'}:
+        revoke_tokens(instance.pk)
+
+
+@receiver(post_delete, sender=models.Consumer)
+@receiver(post_save, sender=models.Consumer)
+@receiver(post_delete, sender=models.Vendor)
+@receiver(post_save, sender=models.Vendor)
+@receiver(post_delete, sender=models.Employee)
+@receiver(post_save, sender=models.Employee)
+def profile_modify_handler(sender, instance, **kwargs):
+    # Token claims carry the profiles, tokens issued before the change must not be trusted anymore.
+    if not kwargs.get('raw'):
+        revoke_tokens(instance.user_id)
+
+
+@receiver(post_delete, sender=models.Store)
+@receiver(post_save, sender=models.Store)
+def store_modify_handler(sender, instance, **kwargs):
+    if not kwargs.get('raw'):
+        revoke_tokens(instance.vendor_id)
+
+
+@receiver(post_save, sender=models.ProductUnit)
+def product_unit_save_handler(sender, instance, created, **kwargs):
+    if created or instance.quantity != getattr(instance, '_loaded_quantity', None):
+        log_stock_changes([instance.pk])
+        instance._loaded_quantity = instance.quantity
+
+
+@receiver(post_save, sender=models.Store)
+def store_threshold_handler(sender, instance, created, **kwargs):
+    if not created and instance.low_stock_threshold != getattr(instance, '_loaded_low_stock_threshold', None):
+        log_store_stock(instance.pk)
+        instance._loaded_low_stock_threshold = instance.low_stock_threshold
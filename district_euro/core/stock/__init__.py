@@ -0,0 +1 @@
+from .logic import log_stock_changes, log_store_stock, check_low_stock, send_low_stock_digests
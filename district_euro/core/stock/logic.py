@@ -0,0 +1,94 @@
+import logging
+from itertools import groupby
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core import models
+from core.email import send_mail_low_stock
+
+logger = logging.getLogger(__name__)
+
+
+def log_stock_changes(product_unit_ids):
+    """
+    Adds product units to the stock change log, so the next low stock check looks at them. Saving a unit with a new
+    quantity logs it already, this is for code that changes quantities with update().
+    """
+    models.StockChange.objects.bulk_create(
+        [models.StockChange(product_unit_id=product_unit_id) for product_unit_id in set(product_unit_ids)])
+
+
+def log_store_stock(store_id):
+    """
+    Adds all the units of a store to the stock change log, for instance when its threshold changes.
+    """
+    log_stock_changes(models.ProductUnit.objects.filter(product__store_id=store_id).values_list('pk', flat=True))
+
+
+def check_low_stock(batch_size=1000):
+    """
+    Opens and resolves the low stock alerts of the units in the stock change log, which is emptied as it goes.
+
+    Each batch of changed units is compared with the thresholds of their stores in a single query. Changes are
+    locked while checked, concurrent runs wait for each other instead of opening the same alerts twice.
+
+    :rtype: tuple
+    :return: amount of alerts opened and amount of alerts resolved.
+    """
+    opened = resolved = 0
+    while True:
+        with transaction.atomic():
+            changes = list(models.StockChange.objects.select_for_update().order_by('id')
+                           .values_list('id', 'product_unit_id')[:batch_size])
+            if not changes:
+                break
+            unit_ids = set(product_unit_id for _, product_unit_id in changes)
+
+            low = models.ProductUnit.objects.filter(pk__in=unit_ids, product__is_active=True,
+                                                    quantity__lte=F('product__store__low_stock_threshold')) \
+                .values_list('pk', 'product__store_id', 'quantity', 'product__store__low_stock_threshold')
+            low = {row[0]: row for row in low}
+            open_alerts = dict(models.LowStockAlert.objects.filter(product_unit_id__in=unit_ids, resolved=None)
+                               .values_list('product_unit_id', 'id'))
+
+            new_alerts = [models.LowStockAlert(product_unit_id=pk, store_id=store_id, quantity=quantity,
+                                               threshold=threshold)
+                          for pk, store_id, quantity, threshold in low.itervalues() if pk not in open_alerts]
+            models.LowStockAlert.objects.bulk_create(new_alerts)
+            recovered = [alert_id for product_unit_id, alert_id in open_alerts.iteritems()
+                         if product_unit_id not in low]
+            if recovered:
+                models.LowStockAlert.objects.filter(pk__in=recovered).update(resolved=timezone.now())
+
+            models.StockChange.objects.filter(pk__in=[change_id for change_id, _ in changes]).delete()
+
+        logger.info('Low stock check of %d units: %d alerts opened, %d resolved', len(unit_ids), len(new_alerts),
+                    len(recovered))
+        opened += len(new_alerts)
+        resolved += len(recovered)
+        if len(changes) < batch_size:
+            break
+    return opened, resolved
+
+
+def send_low_stock_digests():
+    """
+    Queues an email to each store vendor with the open alerts not sent in a digest yet.
+
+    :rtype: int
+    :return: amount of emails queued.
+    """
+    with transaction.atomic():
+        alert_ids = list(models.LowStockAlert.objects.select_for_update().filter(resolved=None, notified=False)
+                         .values_list('id', flat=True))
+        alerts = models.LowStockAlert.objects.filter(pk__in=alert_ids) \
+            .select_related('store__vendor__user', 'product_unit__product').order_by('store_id', 'id')
+        queued = 0
+        for _, store_alerts in groupby(alerts, key=lambda alert: alert.store_id):
+            store_alerts = list(store_alerts)
+            send_mail_low_stock(store_alerts[0].store, store_alerts)
+            queued += 1
+        models.LowStockAlert.objects.filter(pk__in=alert_ids).update(notified=True)
+    return queued
@@ -1,7 +1,13 @@
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
+from rest_framework_jwt.settings import api_settings as jwt_settings
 
 from core import models
+from core.permissions import EmployeePermission, VendorPermission
+from core.rest.auth.authentication import JSONWebTokenAuthentication, revoke_tokens
 from core.rest.auth.views import obtain_jwt_token
 
 
@@ -23,3 +29,58 @@ class VendorTestCase(TestCase):
         response = obtain_jwt_token(request)
 
         self.assertEqual(response.status_code, 200)
+
+    def test_profiles_loaded_with_user(self):
+        vendor = models.Vendor.objects.select_related('user').first()
+        expected = models.User.objects.get(pk=vendor.user_id).profiles
+        user = models.User.objects.get_by_natural_key(vendor.user.email)
+
+        request = self.factory.get('/api/vendor/')
+        request.user = user
+        with self.assertNumQueries(0):
+            self.assertEqual(user.profiles, expected)
+            self.assertTrue(VendorPermission().has_permission(request, None))
+            self.assertEqual(EmployeePermission().has_permission(request, None),
+                             user.get_profile('employee') is not None)
+
+    def test_read_only_authentication_from_claims(self):
+        vendor = models.Vendor.objects.select_related('user').first()
+        user = models.User.objects.get_by_natural_key(vendor.user.email)
+        token = jwt_settings.JWT_ENCODE_HANDLER(jwt_settings.JWT_PAYLOAD_HANDLER(user))
+        header = '%s %s' % (jwt_settings.JWT_AUTH_HEADER_PREFIX, token)
+        store = vendor.store
+
+        request = Request(self.factory.get('/api/vendor/product/', HTTP_AUTHORIZATION=header))
+        with self.assertNumQueries(1):
+            principal, _ = JSONWebTokenAuthentication().authenticate(request)
+            self.assertEqual(principal.pk, user.pk)
+            self.assertEqual(principal.profiles, user.profiles)
+            self.assertEqual(principal.vendor.store.pk, store.pk)
+            self.assertEqual((principal.is_staff, principal.is_superuser), (user.is_staff, user.is_superuser))
+        # Fields that are not in the claims are loaded instead of being left empty.
+        self.assertEqual(principal.vendor.store.name, store.name)
+        self.assertEqual(principal.first_name, user.first_name)
+
+        request = Request(self.factory.post('/api/vendor/product/', HTTP_AUTHORIZATION=header))
+        with self.assertNumQueries(1):
+            JSONWebTokenAuthentication().authenticate(request)
+
+        revoke_tokens(user.pk)
+        request = Request(self.factory.get('/api/vendor/product/', HTTP_AUTHORIZATION=header))
+        with self.assertNumQueries(2):
+            JSONWebTokenAuthentication().authenticate(request)
+
+    def test_read_only_authentication_revoked_elsewhere(self):
+        vendor = models.Vendor.objects.select_related('user').first()
+        user = models.User.objects.get_by_natural_key(vendor.user.email)
+        token = jwt_settings.JWT_ENCODE_HANDLER(jwt_settings.JWT_PAYLOAD_HANDLER(user))
+        header = '%s %s' % (jwt_settings.JWT_AUTH_HEADER_PREFIX, token)
+        request = Request(self.factory.get('/api/vendor/product/', HTTP_AUTHORIZATION=header))
+        self.assertEqual(JSONWebTokenAuthentication().authenticate(request)[0].pk, user.pk)
+
+        # Another process deactivates the user, no signal runs and nothing is kept in this process.
+        models.User.objects.filter(pk=user.pk).update(is_active=False)
+        cache.clear()
+        request = Request(self.factory.get('/api/vendor/product/', HTTP_AUTHORIZATION=header))
+        with self.assertRaises(AuthenticationFailed):
+            JSONWebTokenAuthentication().authenticate(request)
@@ -0,0 +1,82 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.pagination import EstimatedCountPaginator
+from .utils import *
+
+
+class AdminTest(TestCase):
+    fixtures = ('initial_data.yaml',)
+
+    def setUp(self):
+        self.admin = models.User.objects.create_superuser('admin@test.com', 'Admin', 'Admin', 'admin')
+        self.client.force_login(self.admin)
+
+    def get_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def add_rows(self):
+        order = models.Order.objects.select_related('consumer', 'store').first()
+        product = models.Product.objects.select_related('store', 'category').first()
+        dispatch = models.SampleDispatch.objects.first()
+        for _ in range(3):
+            models.Order.objects.create(consumer=order.consumer, store=order.store, total_price=order.total_price,
+                                        shipping_address='Address', total_quantity=1)
+            for is_approved in (True, False):
+                models.Product.objects.create(store=product.store, category=product.category, price=product.price,
+                                              name='Product', is_approved=is_approved)
+            models.SampleDispatch.objects.create(store=dispatch.store, warehouse=dispatch.warehouse)
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        urls = ('/admin/core/order/', '/admin/core/product/', '/admin/core/unapprovedproduct/',
+                '/admin/core/sampledispatch/')
+        queries = [self.get_queries(url) for url in urls]
+        self.add_rows()
+        self.assertEqual([self.get_queries(url) for url in urls], queries)
+
+    def test_change_pages(self):
+        order = models.Order.objects.filter(order_items__isnull=False).first()
+        product = models.Product.objects.filter(units__attributes__isnull=False).first()
+        for url in ('/admin/core/order/%d/change/' % order.pk, '/admin/core/product/%d/change/' % product.pk,
+                    '/admin/core/order/add/', '/admin/core/product/add/'):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_estimated_count(self):
+        orders = models.Order.objects.all()
+        count = orders.count()
+        self.assertEqual(EstimatedCountPaginator(orders, 10).count, count)
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE core_order')
+        paginator = EstimatedCountPaginator(orders, 10)
+        paginator.exact_below = 0
+        with self.assertNumQueries(1):
+            self.assertEqual(paginator.count, count)
+
+    def test_estimated_count_filtered(self):
+        response = self.client.get('/admin/core/product/')
+        count = models.Product.objects.filter(is_approved=True).count()
+        self.assertEqual(response.context['cl'].result_count, count)
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE core_product')
+        self.addCleanup(setattr, EstimatedCountPaginator, 'exact_below', EstimatedCountPaginator.exact_below)
+        EstimatedCountPaginator.exact_below = 0
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/admin/core/product/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(any(query['sql'].startswith('EXPLAIN') for query in queries))
+        self.assertFalse(any('COUNT(' in query['sql'] for query in queries))
+        self.assertGreater(response.context['cl'].result_count, 0)
+
+    def test_approve_action(self):
+        ids = list(models.UnapprovedProduct.objects.values_list('pk', flat=True)[:2])
+        response = self.client.post('/admin/core/unapprovedproduct/',
+                                    {'action': 'approve', '_selected_action': ids})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(models.Product.objects.filter(pk__in=ids, is_approved=True,
+                                                       date_approved__isnull=False).count(), 2)
@@ -0,0 +1,69 @@
+import json
+
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.rest.consumer import views
+from .utils import *
+
+
+class ConsumerTestCase(TestCase):
+    fixtures = ('initial_data.yaml',)
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.consumer = models.Consumer.objects.select_related('user').first()
+        assert self.consumer is not None, "cant run this test without consumers in the database"
+        self.product = models.Product.actives.filter(is_approved=True).first()
+        assert self.product is not None, "cant run this test without approved products in the database"
+        self.units = []
+        for i in xrange(2):
+            self.units.append(models.ProductUnit.objects.create(product=self.product, quantity=10))
+        self.attribute_value = models.AttributeValue.objects.first()
+        self.units[0].attributes.add(self.attribute_value)
+
+    def test_order_create(self):
+        url = '/api/consumer/order/'
+
+        payload = {
+            'shipping_address': 'Test address 1234',
+            'items': [
+                {'product_unit': self.units[0].id, 'quantity': 2},
+                {'product_unit': self.units[1].id, 'quantity': 3},
+                {'product_unit': self.units[0].id, 'quantity': 1},
+            ]
+        }
+        sold_quantity = self.product.sold_quantity
+
+        request = self.factory.post(url, data=json.dumps(payload), content_type='application/json')
+        force_authenticate(request, self.consumer.user)
+        response = views.OrderViewSet.as_view({'post': 'create'})(request)
+
+        self.assertEqual(response.status_code, 201)
+        data = response.data
+        self.assertEqual(data.get('total_quantity'), 6)
+        self.assertEqual(len(data.get('order_items')), 2)
+        self.assertIn({self.attribute_value.attribute_name: self.attribute_value.value},
+                      data.get('order_items')[0].get('attributes'))
+
+        self.assertEqual(models.ProductUnit.objects.get(pk=self.units[0].pk).quantity, 7)
+        self.assertEqual(models.ProductUnit.objects.get(pk=self.units[1].pk).quantity, 7)
+        self.assertEqual(models.Product.objects.get(pk=self.product.pk).sold_quantity, sold_quantity + 6)
+
+    def test_order_create_not_enough_stock(self):
+        url = '/api/consumer/order/'
+
+        payload = {
+            'shipping_address': 'Test address 1234',
+            'items': [
+                {'product_unit': self.units[0].id, 'quantity': 1},
+                {'product_unit': self.units[1].id, 'quantity': 11},
+            ]
+        }
+
+        request = self.factory.post(url, data=json.dumps(payload), content_type='application/json')
+        force_authenticate(request, self.consumer.user)
+        response = views.OrderViewSet.as_view({'post': 'create'})(request)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(models.ProductUnit.objects.get(pk=self.units[0].pk).quantity, 10)
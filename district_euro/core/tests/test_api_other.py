@@ -1,9 +1,10 @@
 import json
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.core.cache import cache
 from rest_framework.test import APIRequestFactory
 
-from core import models
+from core import models, throttling
 from landing import models as landing_models
 from core.rest.other import views
 
@@ -191,9 +192,34 @@ class OtherTestCase(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(join_request_count + 1, landing_models.JoinRequest.objects.count())
+        # Nobody is notified unless addresses are configured.
+        self.assertFalse(models.OutgoingEmail.objects.exists())
 
-
-
-
-
-
+        request = self.factory.post(url, data=json.dumps(data), content_type='application/json')
+        with override_settings(JOIN_REQUEST_EMAILS=['admin@example.com']):
+            response = views.JoinRequestViewSet.as_view({'post': 'create'})(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(models.OutgoingEmail.objects.values_list('recipients', flat=True)),
+                         [['admin@example.com']])
+
+    def test_sliding_window_throttle(self):
+        cache.clear()
+        now = [600.0]
+        throttle_class = throttling.throttle_by('2/min', 'test', base=throttling.SlidingWindowRateThrottle)
+        throttle_class.timer = lambda self: now[0]
+        request = self.factory.get('/api/join-request/')
+
+        self.assertTrue(throttle_class().allow_request(request, None))
+        self.assertTrue(throttle_class().allow_request(request, None))
+        throttle = throttle_class()
+        self.assertFalse(throttle.allow_request(request, None))
+        self.assertEqual(throttle.wait(), 60)
+
+        # A quarter into the next window, the previous one still counts as one and a half requests.
+        now[0] = 675.0
+        self.assertTrue(throttle_class().allow_request(request, None))
+        throttle = throttle_class()
+        self.assertFalse(throttle.allow_request(request, None))
+        self.assertEqual(throttle.wait(), 15)
+        now[0] = 691.0
+        self.assertTrue(throttle_class().allow_request(request, None))
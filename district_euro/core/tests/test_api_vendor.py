@@ -1,8 +1,14 @@
+import codecs
+import csv
+import io
 import json
 
+from django.db import connection
 from django.test import TestCase
+from openpyxl import load_workbook
 from rest_framework.test import APIRequestFactory, force_authenticate
 
+from core import export
 from core.rest.vendor import views, serializers
 from .utils import *
 
@@ -123,6 +129,18 @@ class VendorTestCase(TestCase):
         orders_ids = [o.get('id') for o in data.get('results')]
         self.assertNotIn(existing_order.id, orders_ids)
 
+    def test_unconfirmed_orders_use_open_index(self):
+        request = self.factory.get('/api/vendor/order/unconfirmed/')
+        request.user = self.vendor
+        view = views.OrderView(action='unconfirmed', request=request)
+        sql, params = view.get_queryset().query.sql_with_params()
+        with connection.cursor() as cursor:
+            # The fixture tables are tiny, the planner would rather read them whole.
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute('EXPLAIN ' + sql, params)
+            plan = '\n'.join(row[0] for row in cursor.fetchall())
+        self.assertIn('core_order_open_store_id_created', plan)
+
     def test_order_update_tracking_information(self):
         url = '/api/vendor/order/%s/'
 
@@ -424,6 +442,13 @@ class VendorTestCase(TestCase):
         self.assertIn('units', data)
         self.assertEqual(len(payload.get('units')), len(data.get('units')))
 
+    def test_store_resolved_once(self):
+        vendor = self.vendor.vendor
+        store = vendor.store
+        with self.assertNumQueries(0):
+            self.assertIs(vendor.store, store)
+        self.assertEqual(store, models.Store.objects.filter(vendor=vendor).first())
+
     def test_inventory_list(self):
         url = '/api/vendor/inventory/'
 
@@ -439,6 +464,115 @@ class VendorTestCase(TestCase):
         else:
             self.assertTrue(len(data.get('results')) == 0)
 
+    def test_inventory_compact(self):
+        user = models.ProductUnit.objects.filter(product__is_active=True, product__is_approved=True) \
+            .exclude(attributes=None).select_related('product__store__vendor__user').first().product.store.vendor.user
+        url = '/api/vendor/inventory/'
+        request = self.factory.get(url)
+        force_authenticate(request, user)
+        units = views.InventoryViewSet.as_view({'get': 'list'})(request).data['results']
+
+        request = self.factory.get(url + 'compact/')
+        force_authenticate(request, user)
+        response = views.InventoryViewSet.as_view({'get': 'compact'})(request)
+
+        self.assertEqual(response.status_code, 200)
+        rows = response.data['results']
+        self.assertTrue(len(rows) > 0)
+        self.assertEqual(len(rows), response.data['count'])
+        # Units with the same product name may come in any order.
+        units = {unit['id']: unit for unit in units}
+        self.assertEqual(set(row['id'] for row in rows), set(units))
+        self.assertTrue(any(row['attributes'] for row in rows))
+        for row in rows:
+            unit = units[row['id']]
+            for field in ('product_id', 'sku', 'name', 'price', 'quantity', 'is_approved'):
+                self.assertEqual(row[field], unit[field])
+            self.assertEqual(row['attributes'], sorted(u'%s: %s' % (attribute['attribute_name'], attribute['value'])
+                                                       for attribute in unit['attributes']))
+
+    def test_inventory_compact_search_and_sort(self):
+        unit = models.ProductUnit.objects.filter(product__is_active=True, product__is_approved=True) \
+            .exclude(sku=None).select_related('product__store__vendor__user').first()
+        user = unit.product.store.vendor.user
+        name = unit.product.name[1:4]
+        url = '/api/vendor/inventory/compact/'
+        queries = (
+            ({'search': unit.sku}, lambda row: row['sku'].startswith(unit.sku)),
+            ({'search': name.upper()}, lambda row: name.lower() in row['name'].lower()),
+            ({'max_quantity': unit.quantity}, lambda row: row['quantity'] <= unit.quantity),
+        )
+        for params, matches in queries:
+            request = self.factory.get(url, params)
+            force_authenticate(request, user)
+            rows = views.InventoryViewSet.as_view({'get': 'compact'})(request).data['results']
+            self.assertIn(unit.id, [row['id'] for row in rows])
+            self.assertTrue(all(matches(row) for row in rows))
+
+        request = self.factory.get(url, {'ordering': '-quantity'})
+        force_authenticate(request, user)
+        rows = views.InventoryViewSet.as_view({'get': 'compact'})(request).data['results']
+        quantities = [row['quantity'] for row in rows]
+        self.assertEqual(quantities, sorted(quantities, reverse=True))
+
+    def test_order_export_csv(self):
+        store = models.Order.objects.select_related('store__vendor__user').first().store
+        orders = models.Order.objects.filter(store=store)
+        request = self.factory.get('/api/vendor/order/export/')
+        force_authenticate(request, store.vendor.user)
+        response = views.OrderView.as_view({'get': 'export'})(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="orders.csv"')
+        content = b''.join(response.streaming_content)
+        rows = list(csv.reader(io.BytesIO(content[len(codecs.BOM_UTF8):])))
+        self.assertEqual(tuple(rows[0]), export.ORDER_HEADER)
+        self.assertTrue(len(rows) > 1)
+        self.assertEqual([int(row[0]) for row in rows[1:]], list(orders.order_by('pk').values_list('pk', flat=True)))
+
+    def test_inventory_export_xlsx(self):
+        request = self.factory.get('/api/vendor/inventory/export/', {'type': 'xlsx'})
+        force_authenticate(request, self.vendor)
+        response = views.InventoryViewSet.as_view({'get': 'export'})(request)
+
+        self.assertEqual(response.status_code, 200)
+        workbook = load_workbook(io.BytesIO(b''.join(response.streaming_content)), read_only=True)
+        rows = [[cell.value for cell in row] for row in workbook.get_sheet_by_name('inventory').rows]
+        self.assertEqual(tuple(rows[0]), export.INVENTORY_HEADER)
+        self.assertTrue(len(rows) > 1)
+        units = models.ProductUnit.objects.filter(product__store=self.vendor.vendor.store, product__is_active=True,
+                                                  product__is_approved=True)
+        self.assertEqual([row[0] for row in rows[1:]], list(units.order_by('pk').values_list('pk', flat=True)))
+
+    def test_export_invalid_type(self):
+        request = self.factory.get('/api/vendor/inventory/export/', {'type': 'pdf'})
+        force_authenticate(request, self.vendor)
+        response = views.InventoryViewSet.as_view({'get': 'export'})(request)
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_formula_cells(self):
+        header = ('Name', 'Address', 'Total')
+        rows = [(u'=HYPERLINK("http://example.com")', u'@SUM(A1)', -5), (u'+1', u'-2', 3), (u'Plain', None, 0)]
+
+        response = export.export_response(export.CSV, 'test', header, iter(rows))
+        content = b''.join(response.streaming_content)
+        csv_rows = list(csv.reader(io.BytesIO(content[len(codecs.BOM_UTF8):])))
+        self.assertEqual(csv_rows[1:], [["'=HYPERLINK(\"http://example.com\")", "'@SUM(A1)", '-5'],
+                                        ["'+1", "'-2", '3'], ['Plain', '', '0']])
+
+        response = export.export_response(export.XLSX, 'test', header, iter(rows))
+        workbook = load_workbook(io.BytesIO(b''.join(response.streaming_content)))
+        cells = list(workbook.get_sheet_by_name('test').rows)[1]
+        self.assertEqual([cell.value for cell in cells], [u'=HYPERLINK("http://example.com")', u'@SUM(A1)', -5])
+        self.assertEqual([cell.data_type for cell in cells], ['s', 's', 'n'])
+
+    def test_export_chunks(self):
+        queryset = models.ProductUnit.objects.all()
+        expected = list(queryset.order_by('pk').values_list('pk', flat=True))
+        self.assertTrue(len(expected) > 2)
+        self.assertEqual([unit.pk for unit in export.iterate_chunked(queryset, chunk_size=2)], expected)
+        self.assertEqual([row['id'] for row in export.iterate_chunked(queryset.values('id'), chunk_size=2)], expected)
+
     def test_sample_dispatch_create(self):
         url = '/api/vendor/sample-dispatch/'
         store = self.vendor.vendor.store
@@ -539,3 +673,26 @@ class VendorTestCase(TestCase):
         all_ids = [c.get('id') for c in data.get('results')]
 
         self.assertNotIn(attribute2.id, all_ids)
+
+    def test_overview_multiple_types(self):
+        url = '/api/vendor/overview/?types=Visits,sales'
+
+        store = self.vendor.vendor.store
+        visits = models.OverviewType.objects.get(name='visits')
+        for month in xrange(13):
+            year, month_number = 2015 + month / 12, month % 12 + 1
+            models.PeriodOverview.objects.create(store=store, type=visits, value=month,
+                                                 date_from='%d-%02d-01' % (year, month_number),
+                                                 date_to='%d-%02d-28' % (year, month_number))
+
+        request = self.factory.get(url)
+        force_authenticate(request, self.vendor)
+        response = views.OverviewView.as_view()(request)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.data
+        self.assertIn('visits', data)
+        self.assertIn('sales', data)
+        self.assertEqual(len(data.get('visits')), 12)
+        self.assertEqual(data.get('visits'),
+                         views.OverviewView.as_view()(request, type='visits').data)
@@ -0,0 +1,56 @@
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from core.email import queue_mail, send_queued_emails
+from core.email.logic import _claim_emails
+from .utils import *
+
+
+class FailingEmailBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        raise IOError('Mail server unavailable')
+
+
+class OutgoingEmailTest(TestCase):
+    def test_send_queued_emails(self):
+        email = queue_mail('Subject', 'Body', ['someone@example.com'], html_message='<p>Body</p>')
+        queue_mail('Other subject', 'Other body', ['other@example.com'])
+
+        call_command('send_queued_emails', verbosity=0)
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(mail.outbox[0].to, ['someone@example.com'])
+        self.assertEqual(mail.outbox[0].alternatives, [('<p>Body</p>', 'text/html')])
+        email.refresh_from_db()
+        self.assertEqual(email.status, models.OutgoingEmail.SENT)
+        self.assertIsNotNone(email.sent)
+        self.assertEqual(send_queued_emails(), (0, 0))
+
+    @override_settings(EMAIL_BACKEND='core.tests.test_email.FailingEmailBackend')
+    def test_failed_emails_retried(self):
+        email = queue_mail('Subject', 'Body', ['someone@example.com'])
+
+        self.assertEqual(send_queued_emails(max_attempts=2), (0, 1))
+        email.refresh_from_db()
+        self.assertEqual(email.status, models.OutgoingEmail.PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertIn('Mail server unavailable', email.last_error)
+
+        # Not due until the retry delay is over.
+        self.assertEqual(send_queued_emails(max_attempts=2), (0, 0))
+        models.OutgoingEmail.objects.update(next_attempt=email.created)
+        self.assertEqual(send_queued_emails(max_attempts=2), (0, 1))
+        email.refresh_from_db()
+        self.assertEqual(email.status, models.OutgoingEmail.FAILED)
+
+    def test_claimed_emails_skipped(self):
+        queue_mail('Subject', 'Body', ['someone@example.com'])
+        queue_mail('Other subject', 'Other body', ['other@example.com'])
+
+        # Another worker is sending the first one.
+        self.assertEqual(len(_claim_emails(1)), 1)
+        self.assertEqual(send_queued_emails(), (1, 0))
+        self.assertEqual([message.to for message in mail.outbox], [['other@example.com']])
+        self.assertEqual(models.OutgoingEmail.objects.filter(status=models.OutgoingEmail.PENDING).count(), 1)
@@ -0,0 +1,85 @@
+import logging
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.db.models import Q
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from core import models
+from core.logger import QueuedDistrictEuroLoggingHandler
+
+
+class QueuedLoggingHandlerTest(TransactionTestCase):
+    def get_logger(self, handler):
+        logger = logging.getLogger('core.tests.queued')
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        logger.handlers = [handler]
+        return logger
+
+    def test_records_saved_on_close(self):
+        handler = QueuedDistrictEuroLoggingHandler(batch_size=10, flush_interval=60000)
+        logger = self.get_logger(handler)
+
+        try:
+            with transaction.atomic():
+                logger.info('first message')
+                logger.error('second message')
+                raise ValueError()
+        except ValueError:
+            pass
+        handler.close()
+
+        # Records are saved on a connection of their own, the rollback doesn't remove them.
+        logs = list(models.SystemLog.objects.filter(message__endswith='message').order_by('id'))
+        self.assertEqual([(log.level, log.message) for log in logs],
+                         [('INFO', 'first message'), ('ERROR', 'second message')])
+        self.assertEqual(logs[0].extra['logger'], 'core.tests.queued')
+        self.assertEqual(logs[0].extra['function'], 'test_records_saved_on_close')
+
+    def test_close_keeps_caller_connection(self):
+        handler = QueuedDistrictEuroLoggingHandler(batch_size=10, flush_interval=60000)
+        logger = self.get_logger(handler)
+        logger.info('forked message')
+        # As in a forked process, the background thread belongs to the parent.
+        handler._pid = -1
+
+        with transaction.atomic():
+            models.SystemLog.objects.count()
+            handler.close()
+            self.assertTrue(connection.in_atomic_block)
+            self.assertIsNotNone(connection.connection)
+            models.SystemLog.objects.count()
+
+        self.assertTrue(models.SystemLog.objects.filter(message='forked message').exists())
+
+    def test_drop_oldest_when_full(self):
+        handler = QueuedDistrictEuroLoggingHandler(capacity=2, batch_size=10, flush_interval=60000)
+        logger = self.get_logger(handler)
+
+        for i in xrange(5):
+            logger.info('message %d', i)
+        handler.close()
+
+        self.assertEqual(handler.dropped, 3)
+        query = Q(message__startswith='message') | Q(message__contains='dropped')
+        messages = list(models.SystemLog.objects.filter(query).order_by('id')
+                        .values_list('message', flat=True))
+        self.assertEqual(messages[:2], ['message 3', 'message 4'])
+        self.assertIn('3 log records dropped', messages[2])
+
+
+class PurgeSystemLogsTest(TestCase):
+    def test_purge_expired_logs(self):
+        now = timezone.now()
+        for days in (1, 89, 91, 200, 300):
+            models.SystemLog.objects.create(level='INFO', message='purge %d' % days,
+                                            create_date=now - timedelta(days=days))
+
+        call_command('purge_system_logs', days=90, batch_size=2, verbosity=0)
+
+        messages = set(models.SystemLog.objects.filter(message__startswith='purge')
+                       .values_list('message', flat=True))
+        self.assertEqual(messages, {'purge 1', 'purge 89'})
@@ -0,0 +1,57 @@
+import codecs
+
+from django.conf.urls import url
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from core import export
+from core.middleware import DeferTranslationsMiddleware
+from modeltranslation.utils import translations_deferred
+
+
+def deferred_view(request):
+    return HttpResponse(str(translations_deferred()))
+
+
+def raising_view(request):
+    raise ValueError('view failed')
+
+
+def export_view(request):
+    rows = ((translations_deferred(),) for _ in range(3))
+    return export.export_response(export.CSV, 'deferred', ('deferred',), rows)
+
+
+urlpatterns = [
+    url(r'^api/deferred/$', deferred_view),
+    url(r'^api/raise/$', raising_view),
+    url(r'^api/export/$', export_view),
+    url(r'^deferred/$', deferred_view),
+]
+
+
+@override_settings(ROOT_URLCONF='core.tests.test_middleware')
+class DeferTranslationsMiddlewareTest(SimpleTestCase):
+    def test_api_request(self):
+        self.assertEqual(self.client.get('/api/deferred/').content, b'True')
+        self.assertFalse(translations_deferred())
+        self.assertEqual(self.client.get('/deferred/').content, b'False')
+
+    def test_raising_view(self):
+        with self.assertRaises(ValueError):
+            self.client.get('/api/raise/')
+        self.assertFalse(translations_deferred())
+
+    def test_unfinished_request_does_not_leak(self):
+        # A response middleware before this one raised, process_response never ran.
+        DeferTranslationsMiddleware().process_request(RequestFactory().get('/api/deferred/'))
+        self.assertTrue(translations_deferred())
+        self.assertEqual(self.client.get('/deferred/').content, b'False')
+
+    def test_streaming_export(self):
+        response = self.client.get('/api/export/')
+        self.assertFalse(translations_deferred())
+
+        content = b''.join(response.streaming_content)
+        self.assertEqual(content[len(codecs.BOM_UTF8):].split(), [b'deferred', b'True', b'True', b'True'])
+        self.assertFalse(translations_deferred())
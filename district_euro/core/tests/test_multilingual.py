@@ -0,0 +1,52 @@
+from django.db import models as db_models
+from django.test import TestCase
+from django.utils import translation
+
+from modeltranslation.manager import append_fallback, rewrite_lookup_key
+from modeltranslation.translator import NotRegistered, TranslationOptions, translator
+from .utils import *
+
+
+class LookupCacheNote(db_models.Model):
+    title = db_models.CharField(max_length=255)
+
+    class Meta:
+        app_label = 'core'
+        managed = False
+
+
+class LookupCacheNoteTranslationOptions(TranslationOptions):
+    fields = ('title',)
+
+
+class MultilingualQuerySetTest(TestCase):
+    fixtures = ('initial_data.yaml',)
+
+    def test_distinct_translated_field(self):
+        with translation.override('es'):
+            # Both are rewritten to name_es, DISTINCT ON has to match the ORDER BY.
+            products = list(models.Product.objects.distinct('name').order_by('name'))
+            self.assertEqual(len(products), len(set(models.Product.objects.values_list('name_es', flat=True))))
+
+            with self.assertRaises(ValueError):
+                models.Product.objects.sql_fallbacks().distinct('name')
+            # Fields that are not translated still work.
+            stores = models.Product.objects.sql_fallbacks().distinct('store').order_by('store', 'name') \
+                .values_list('store_id', flat=True)
+            self.assertEqual(len(stores), len(set(stores)))
+
+    def test_register_clears_lookup_caches(self):
+        with translation.override('en'):
+            # Cached while the model is not translated.
+            self.assertEqual(rewrite_lookup_key(LookupCacheNote, 'title__icontains'), 'title__icontains')
+
+            translator.register(LookupCacheNote, LookupCacheNoteTranslationOptions)
+            try:
+                self.assertEqual(rewrite_lookup_key(LookupCacheNote, 'title__icontains'), 'title_en__icontains')
+                self.assertEqual(append_fallback(LookupCacheNote, ['title'])[1], {'title'})
+            finally:
+                translator.unregister(LookupCacheNote)
+
+            self.assertEqual(rewrite_lookup_key(LookupCacheNote, 'title__icontains'), 'title__icontains')
+            with self.assertRaises(NotRegistered):
+                append_fallback(LookupCacheNote, ['title'])
@@ -0,0 +1,90 @@
+import moneyed
+from django.test import TestCase
+from django.utils import timezone
+
+from core import overview
+from .utils import *
+
+
+class OverviewRollupTest(TestCase):
+    fixtures = ('initial_data.yaml',)
+
+    def setUp(self):
+        self.store = models.Store.objects.first()
+        self.consumer = models.Consumer.objects.first()
+
+    def create_order(self, created, quantity=2, amount=10, currency='USD', **kwargs):
+        return models.Order.objects.create(consumer=self.consumer, store=self.store, shipping_address='address',
+                                           total_price=moneyed.Money(amount, currency), total_quantity=quantity,
+                                           created=created, **kwargs)
+
+    def get_periods(self, type_name):
+        return list(models.PeriodOverview.objects.filter(store=self.store, type_id=type_name).order_by('date_from'))
+
+    def test_rollup_incremental(self):
+        now = timezone.now()
+        last_month = now.replace(day=1) - timezone.timedelta(days=1)
+        self.create_order(last_month)
+        overview.rebuild_overviews()
+
+        sales_before = {p.date_from: p.value for p in self.get_periods(overview.SALES)}
+        units_before = self.get_periods(overview.UNITS)[-1]
+
+        # Nothing new, nothing changes.
+        self.assertEqual(overview.rollup_overviews(), 0)
+
+        self.create_order(now, quantity=3)
+        self.create_order(last_month, quantity=1, amount=5)
+        overview.rollup_overviews()
+
+        sales = self.get_periods(overview.SALES)
+        sales_by_month = {p.date_from: p for p in sales}
+        current_month = now.date().replace(day=1)
+        previous_month = last_month.date().replace(day=1)
+        self.assertEqual(sales_by_month[current_month].value, sales_before.get(current_month, 0) + 1)
+        self.assertEqual(sales_by_month[previous_month].value, sales_before[previous_month] + 1)
+
+        # Aggregate value is the running total of all periods.
+        running = 0
+        for period in sales:
+            running += period.value
+            self.assertEqual(period.aggregate_value, running)
+
+        units = self.get_periods(overview.UNITS)[-1]
+        self.assertEqual(units.date_from, current_month)
+        self.assertEqual(units.aggregate_value, units_before.aggregate_value + 4)
+
+    def test_rollup_late_commit(self):
+        now = timezone.now()
+        overview.rebuild_overviews()
+        sales_before = sum(p.value for p in self.get_periods(overview.SALES))
+
+        # An order that took its id but was not committed yet when the rollup ran.
+        late = self.create_order(now)
+        models.Order.objects.filter(pk=late.pk).delete()
+        self.create_order(now)
+        overview.rollup_overviews()
+        self.assertEqual(sum(p.value for p in self.get_periods(overview.SALES)), sales_before + 1)
+
+        self.create_order(now, pk=late.pk)
+        overview.rollup_overviews()
+        self.assertEqual(sum(p.value for p in self.get_periods(overview.SALES)), sales_before + 2)
+        self.assertNotIn(str(late.pk), models.OverviewWatermark.objects.get(name='order').pending_ids)
+
+        # Counted once.
+        self.assertEqual(overview.rollup_overviews(), 0)
+
+    def test_revenue_by_currency(self):
+        now = timezone.now()
+        overview.rebuild_overviews()
+        usd = sum(p.value for p in self.get_periods(overview.revenue_type('USD')))
+        cny = sum(p.value for p in self.get_periods(overview.revenue_type('CNY')))
+
+        self.create_order(now, amount=10, currency='USD')
+        self.create_order(now, amount=7, currency='CNY')
+        # Revenue is gross, returned orders still count.
+        self.create_order(now, amount=5, currency='USD', status=models.Order.RETURNED)
+        overview.rollup_overviews()
+
+        self.assertEqual(sum(p.value for p in self.get_periods(overview.revenue_type('USD'))), usd + 1500)
+        self.assertEqual(sum(p.value for p in self.get_periods(overview.revenue_type('CNY'))), cny + 700)
@@ -0,0 +1,62 @@
+from django.test import TransactionTestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.product import approve_products, products_approved
+from core.rest.other import views
+from .utils import *
+
+
+class ProductApprovalTest(TransactionTestCase):
+    # Approvals are announced on commit, which never happens inside TestCase. Content types the fixture points to
+    # are flushed after every test, so they are restored.
+    fixtures = ('initial_data.yaml',)
+    serialized_rollback = True
+
+    def setUp(self):
+        product = models.Product.objects.select_related('store', 'category').first()
+        self.store = product.store
+        self.products = [models.Product.objects.create(store=self.store, category=product.category,
+                                                       price=product.price, name='Product %d' % i)
+                         for i in range(3)]
+        self.sent = []
+        products_approved.connect(self.receiver)
+
+    def tearDown(self):
+        products_approved.disconnect(self.receiver)
+
+    def receiver(self, sender, product_ids, store_ids, **kwargs):
+        self.sent.append((sorted(product_ids), store_ids))
+
+    def test_approve_products(self):
+        ids = [product.pk for product in self.products]
+        queryset = models.UnapprovedProduct.objects.filter(pk__in=ids)
+        self.assertEqual(approve_products(queryset), 3)
+        self.assertEqual(self.sent, [(ids, {self.store.pk})])
+        products = models.Product.objects.filter(pk__in=ids)
+        self.assertEqual(products.filter(is_approved=True, date_approved__isnull=False).count(), 3)
+
+        self.assertEqual(approve_products(queryset), 0)
+        self.assertEqual(len(self.sent), 1)
+
+    def test_approve_by_store(self):
+        admin = models.User.objects.create_superuser('admin@test.com', 'Admin', 'Admin', 'admin')
+        request = APIRequestFactory().post('/api/product-approval/', {'store': self.store.pk}, format='json')
+        force_authenticate(request, admin)
+        response = views.ProductApprovalView.as_view()(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['approved'] >= 3)
+        self.assertFalse(models.UnapprovedProduct.objects.filter(store=self.store).exists())
+        self.assertEqual(len(self.sent), 1)
+
+    def test_approval_requires_staff_and_scope(self):
+        vendor = self.store.vendor.user
+        request = APIRequestFactory().post('/api/product-approval/', {'store': self.store.pk}, format='json')
+        force_authenticate(request, vendor)
+        self.assertEqual(views.ProductApprovalView.as_view()(request).status_code, 403)
+
+        admin = models.User.objects.create_superuser('admin@test.com', 'Admin', 'Admin', 'admin')
+        request = APIRequestFactory().post('/api/product-approval/', {}, format='json')
+        force_authenticate(request, admin)
+        self.assertEqual(views.ProductApprovalView.as_view()(request).status_code, 400)
+        self.assertFalse(models.Product.objects.filter(pk=self.products[0].pk, is_approved=True).exists())
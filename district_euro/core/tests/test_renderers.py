@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+import json
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from django.utils.translation import ugettext_lazy as _
+from moneyed import Money
+
+from core.renderers import UTF8JSONRenderer
+
+
+class UTF8JSONRendererTest(SimpleTestCase):
+    def render(self, data):
+        return UTF8JSONRenderer().render(data)
+
+    def test_non_ascii_as_utf8(self):
+        data = {'name': u'有机绿茶 "tea" \\u4e2d', 'price': Decimal('1.50'), 'total': Money(150, 'USD'),
+                'label': _('Vendor')}
+        ret = self.render(data)
+        self.assertIn(u'有机绿茶'.encode('utf-8'), ret)
+        self.assertEqual(json.loads(ret.decode('utf-8')),
+                         {'name': data['name'], 'price': 1.5, 'total': unicode(data['total']), 'label': 'Vendor'})
+
+    def test_unsafe_escapes_kept(self):
+        for text in (u'tab\x01', u'emoji \U0001f600', u'line\u2028'):
+            ret = self.render({'text': u'有机' + text})
+            self.assertEqual(json.loads(ret), {'text': u'有机' + text})
+            self.assertNotIn(u'有机'.encode('utf-8'), ret)
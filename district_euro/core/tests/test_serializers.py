@@ -0,0 +1,67 @@
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.serializers import ListSerializer, ModelSerializer, SerializerMethodField
+from rest_framework.test import APIRequestFactory
+from rest_framework.viewsets import GenericViewSet
+
+from core.rest.common import serializers as common
+from core.rest.employee import serializers as employee
+from core.rest.vendor import serializers as vendor
+from core.utils.mixins import CompiledListMixin
+from core.utils.serializers import CompiledListSerializer
+from .utils import *
+
+
+class CompiledListSerializerTest(TestCase):
+    fixtures = ('initial_data.yaml',)
+
+    def assertSameOutput(self, serializer_class, queryset):
+        self.assertTrue(queryset.exists(), "cant run this test without %s in the database" % queryset.model.__name__)
+        context = {'request': APIRequestFactory().get('/')}
+        expected = ListSerializer(queryset, child=serializer_class(context=context), context=context).data
+        compiled = CompiledListSerializer(queryset, child=serializer_class(context=context), context=context).data
+        self.assertEqual(JSONRenderer().render(compiled), JSONRenderer().render(expected))
+
+    def test_same_output(self):
+        self.assertSameOutput(common.ProductSerializer, models.Product.objects.all())
+        self.assertSameOutput(common.OrderSerializer, models.Order.objects.all())
+        self.assertSameOutput(common.SampleSerializer, models.Sample.objects.all())
+        self.assertSameOutput(common.ShowroomSerializer, models.Showroom.objects.all())
+        self.assertSameOutput(employee.SampleSerializer, models.Sample.objects.all())
+        self.assertSameOutput(vendor.InventorySerializer, models.ProductUnit.objects.all())
+
+    def test_order_list_projection(self):
+        orders = models.Order.objects.order_by('id')
+        self.assertTrue(orders.exists(), "cant run this test without orders in the database")
+        expected = common.OrderSerializer(orders, many=True).data
+        with self.assertNumQueries(1):
+            projected = common.OrderListSerializer(common.OrderListSerializer.project(orders), many=True).data
+        self.assertEqual(JSONRenderer().render(projected), JSONRenderer().render(expected))
+
+    def test_mixin_keeps_view_overrides(self):
+        class ShowroomSerializer(ModelSerializer):
+            label = SerializerMethodField()
+
+            class Meta:
+                model = models.Showroom
+                fields = ('id', 'label')
+
+            def get_label(self, showroom):
+                return '%s %d' % (self.context['prefix'], showroom.id)
+
+        class ShowroomViewSet(CompiledListMixin, GenericViewSet):
+            serializer_class = ShowroomSerializer
+
+            def get_serializer_context(self):
+                context = super(ShowroomViewSet, self).get_serializer_context()
+                context['prefix'] = 'showroom'
+                return context
+
+        showrooms = models.Showroom.objects.order_by('id')
+        self.assertTrue(showrooms.exists(), "cant run this test without showrooms in the database")
+        view = ShowroomViewSet(request=APIRequestFactory().get('/'), format_kwarg=None)
+        serializer = view.get_serializer(showrooms, many=True)
+
+        self.assertIsInstance(serializer, CompiledListSerializer)
+        self.assertEqual([item['label'] for item in serializer.data],
+                         ['showroom %d' % showroom.id for showroom in showrooms])
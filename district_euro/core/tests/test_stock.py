@@ -0,0 +1,77 @@
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.order import place_order
+from core.rest.vendor import views
+from core.stock import check_low_stock, send_low_stock_digests
+from .utils import *
+
+
+class LowStockTest(TestCase):
+    fixtures = ('initial_data.yaml',)
+
+    def setUp(self):
+        self.unit = models.ProductUnit.objects.filter(product__is_active=True, quantity__gt=3) \
+            .select_related('product__store__vendor__user').first()
+        assert self.unit is not None, "cant run this test without product units in the database"
+        self.store = self.unit.product.store
+        self.store.low_stock_threshold = 2
+        self.store.save()
+        # Start from an empty change log.
+        check_low_stock()
+
+    def get_open_alerts(self):
+        return models.LowStockAlert.objects.filter(product_unit=self.unit, resolved=None)
+
+    def test_order_opens_alert(self):
+        consumer = models.Consumer.objects.first()
+        place_order(consumer, 'Address', [(self.unit.pk, self.unit.quantity - 1)])
+        self.assertEqual(check_low_stock(), (1, 0))
+        alert = self.get_open_alerts().get()
+        self.assertEqual((alert.quantity, alert.threshold, alert.store_id), (1, 2, self.store.pk))
+
+        # Nothing changed since.
+        self.assertEqual(check_low_stock(), (0, 0))
+
+        unit = models.ProductUnit.objects.get(pk=self.unit.pk)
+        unit.quantity = 10
+        unit.save()
+        self.assertEqual(check_low_stock(), (0, 1))
+        self.assertFalse(self.get_open_alerts().exists())
+
+    def test_only_quantity_changes_are_logged(self):
+        unit = models.ProductUnit.objects.get(pk=self.unit.pk)
+        unit.sku = 'OTHER'
+        unit.save()
+        self.assertFalse(models.StockChange.objects.exists())
+        unit.quantity = 0
+        unit.save()
+        self.assertEqual(list(models.StockChange.objects.values_list('product_unit_id', flat=True)), [unit.pk])
+
+    def test_threshold_change_checks_store(self):
+        self.store.low_stock_threshold = self.unit.quantity
+        self.store.save()
+        check_low_stock(batch_size=1)
+        self.assertTrue(self.get_open_alerts().exists())
+        units = models.ProductUnit.objects.filter(product__store=self.store, product__is_active=True)
+        self.assertEqual(models.LowStockAlert.objects.filter(store=self.store, resolved=None).count(),
+                         units.filter(quantity__lte=self.unit.quantity).count())
+
+    def test_alert_list_and_digest(self):
+        models.ProductUnit.objects.filter(pk=self.unit.pk).update(quantity=0)
+        models.StockChange.objects.create(product_unit=self.unit)
+        check_low_stock()
+
+        request = APIRequestFactory().get('/api/vendor/low-stock-alert/')
+        force_authenticate(request, self.store.vendor.user)
+        response = views.LowStockAlertViewSet.as_view({'get': 'list'})(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn((self.unit.pk, 0), [(alert['product_unit_id'], alert['quantity'])
+                                          for alert in response.data['results']])
+
+        self.assertEqual(send_low_stock_digests(), 1)
+        email = models.OutgoingEmail.objects.get()
+        self.assertEqual(email.recipients, [self.store.vendor.user.email])
+        self.assertIn(self.unit.product.name, email.body)
+        # Alerts are sent once.
+        self.assertEqual(send_low_stock_digests(), 0)
@@ -0,0 +1,43 @@
+from django.test import TestCase
+
+from core.vendor import bulk_store_locations
+from .utils import *
+
+
+class StoreCountriesTest(TestCase):
+    fixtures = ('initial_data.yaml',)
+
+    def setUp(self):
+        self.store = models.Store.objects.first()
+        assert self.store is not None, "cant run this test without stores in the database"
+        self.store.store_location.all().delete()
+        self.regions = []
+        for name in ('First', 'Second'):
+            country = models.Country.objects.create(name=name)
+            city = models.City.objects.create(name=name, country=country)
+            self.regions.append(models.Region.objects.create(name=name, city=city))
+
+    def get_countries(self):
+        return set(self.store.countries.values_list('name', flat=True))
+
+    def test_locations_update_countries(self):
+        first = models.StoreLocation.objects.create(store=self.store, region=self.regions[0])
+        other = models.StoreLocation.objects.create(store=self.store, region=self.regions[0])
+        self.assertEqual(self.get_countries(), {'First'})
+
+        first.delete()
+        self.assertEqual(self.get_countries(), {'First'})
+
+        other.region = self.regions[1]
+        other.save()
+        self.assertEqual(self.get_countries(), {'Second'})
+
+        other.delete()
+        self.assertEqual(self.get_countries(), set())
+
+    def test_bulk_store_locations(self):
+        with bulk_store_locations():
+            for region in self.regions * 3:
+                models.StoreLocation.objects.create(store=self.store, region=region)
+            self.assertEqual(self.get_countries(), set())
+        self.assertEqual(self.get_countries(), {'First', 'Second'})
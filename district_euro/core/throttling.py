@@ -1,10 +1,61 @@
 from rest_framework.throttling import SimpleRateThrottle
 
 
-def throttle_by(rate, scope):
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    Rate throttle that counts requests instead of keeping their history.
+
+    Requests are counted per fixed window of the rate duration, the sliding window estimate is the count of the
+    current window plus the count of the previous one weighted by how much of it the sliding window still covers.
+    Each request costs one read of both counters and one atomic increment, whatever the rate.
+    """
+
+    def get_window_key(self, window):
+        return '%s_%d' % (self.key, window)
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        current_key, previous_key = self.get_window_key(window), self.get_window_key(window - 1)
+        counts = self.cache.get_many([current_key, previous_key])
+        self.current = counts.get(current_key, 0)
+        self.previous = counts.get(previous_key, 0)
+        self.remaining = self.duration - self.now % self.duration
+
+        if self.current + self.previous * self.remaining / self.duration >= self.num_requests:
+            return self.throttle_failure()
+        self.count_request(current_key)
+        return True
+
+    def count_request(self, key):
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            # First request of the window, kept until the next window is over since it is read as the previous one.
+            if not self.cache.add(key, 1, self.duration * 2):
+                self.cache.incr(key)
+
+    def wait(self):
+        """
+        Returns the recommended next request time in seconds.
+        """
+        if self.previous and self.current < self.num_requests:
+            # The weight of the previous window keeps falling until the estimate is under the limit.
+            return max(self.remaining - self.duration * float(self.num_requests - self.current) / self.previous, 0)
+        return self.remaining
+
+
+def throttle_by(rate, scope, base=SimpleRateThrottle):
     _rate, _scope = rate, scope
 
-    class InnerThrottle(SimpleRateThrottle):
+    class InnerThrottle(base):
         rate = _rate
         scope = _scope
 
@@ -2,6 +2,7 @@ from django.conf.urls import url, include
 from rest_framework.routers import DefaultRouter
 
 from core.rest.common import views as common_views
+from core.rest.consumer import views as consumer_views
 from core.rest.other import views as other_views
 from core.rest.vendor import views as vendor_views
 from core.rest.employee import views as employee_views
@@ -14,10 +15,12 @@ vendor_router.register('inventory', vendor_views.InventoryViewSet, base_name='in
 vendor_router.register('sample', vendor_views.ProductSampleViewSet, base_name='sample')
 vendor_router.register('sample-dispatch', vendor_views.SampleDispatchViewSet, base_name='sample-dispatch')
 vendor_router.register('product-attribute', vendor_views.AttributeViewSet, base_name='product-attributes')
+vendor_router.register('low-stock-alert', vendor_views.LowStockAlertViewSet, base_name='low-stock-alert')
 
 _vendor_urls = [
     url(r'^vendor/', include(vendor_router.urls)),
     url(r'^vendor/bulk-upload/?$', vendor_views.product_bulk_upload),
+    url(r'^vendor/overview/?$', vendor_views.OverviewView.as_view()),
     url(r'^vendor/overview/(?P<type>\w+)/?', vendor_views.OverviewView.as_view())
 ]
 
@@ -30,6 +33,13 @@ _employee_urls = [
     url(r'^employee/', include(employee_router.urls)),
 ]
 
+consumer_router = DefaultRouter()
+consumer_router.register('order', consumer_views.OrderViewSet, base_name='consumer-order')
+
+_consumer_urls = [
+    url(r'^consumer/', include(consumer_router.urls)),
+]
+
 api_router = DefaultRouter()
 api_router.register('product', other_views.ProductViewSet, base_name='products')
 api_router.register('store', other_views.StoreViewSet, base_name='stores')
@@ -51,6 +61,7 @@ _api_miscellaneous = [
                          url(r'^image/join-us/(?P<pk>\d+)/?$',
                              common_views.ImageUploadViewJoinUs.as_view()),
                          url(r'^language/?$', other_views.LanguageListView.as_view()),
+                         url(r'^product-approval/?$', other_views.ProductApprovalView.as_view()),
                      ] + api_router.urls
 
-api_urls = _vendor_urls + _api_miscellaneous + _employee_urls
+api_urls = _vendor_urls + _api_miscellaneous + _employee_urls + _consumer_urls
@@ -1,6 +1,10 @@
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.response import Response
 from rest_framework import serializers
 
+from .serializers import CompiledListSerializer
+
+
 class PartialUpdateModelMixin(object):
     """
     Partial updates a model instance.
@@ -18,6 +22,24 @@ class PartialUpdateModelMixin(object):
         serializer.save()
 
 
+class CompiledListMixin(object):
+    """
+    Serializes read only lists with CompiledListSerializer, unless the serializer has its own list serializer.
+
+    The list is built by the usual get_serializer first, so overridden serializer classes, contexts and arguments
+    still apply.
+    """
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super(CompiledListMixin, self).get_serializer(*args, **kwargs)
+        if type(serializer) is serializers.ListSerializer and self.request.method in SAFE_METHODS:
+            # A bound child can not be bound again, it is built anew with its own arguments.
+            child = serializer.child
+            kwargs = dict(serializer._kwargs, child=type(child)(*child._args, **child._kwargs))
+            return CompiledListSerializer(*serializer._args, **kwargs)
+        return serializer
+
+
 class UserViewMixin(object):
     def get_user_id(self):
         return self.request.user.id
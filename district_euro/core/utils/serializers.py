@@ -0,0 +1,114 @@
+from collections import OrderedDict
+from operator import attrgetter
+
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
+from django.db import models
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import ManyRelatedField, PKOnlyObject, RelatedField
+
+
+def _overrides(obj, base, name):
+    return getattr(type(obj), name).__func__ is not getattr(base, name).__func__
+
+
+def _is_field_path(model, attrs):
+    """
+    Returns True when every attribute of the path is a model field reached through relations, so none of them can be
+    a callable DRF would call.
+    """
+    for attr in attrs:
+        if model is None:
+            return False
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return False
+        if field.auto_created and not field.concrete and field.get_accessor_name() != attr:
+            return False
+        model = field.related_model if field.is_relation else None
+    return True
+
+
+def _compile_getter(field, model):
+    if field.source == '*':
+        return lambda instance: instance
+
+    if isinstance(field, ManyRelatedField) or (isinstance(field, RelatedField) and field.use_pk_only_optimization()):
+        def get_related(instance):
+            attribute = field.get_attribute(instance)
+            if isinstance(attribute, PKOnlyObject) and attribute.pk is None:
+                return None
+            return attribute
+        return get_related
+
+    if model is None or not _is_field_path(model, field.source_attrs):
+        return field.get_attribute
+
+    getter = attrgetter('.'.join(field.source_attrs))
+
+    def get(instance):
+        try:
+            return getter(instance)
+        except (AttributeError, ObjectDoesNotExist):
+            # None in the middle of the path or a missing relation, DRF knows what to do with them.
+            return field.get_attribute(instance)
+    return get
+
+
+def _compile_list(serializer):
+    to_representation = compile_serializer(serializer.child)
+
+    def represent(data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        return [to_representation(item) for item in iterable]
+    return represent
+
+
+def compile_serializer(serializer):
+    """
+    Turns a bound serializer into a function that represents one instance, giving the same output as its
+    to_representation.
+
+    Sources made only of model fields are read with attrgetter, method fields call their method directly and nested
+    serializers are compiled too. Anything else goes through the field as usual.
+
+    :rtype: function
+    """
+    if _overrides(serializer, serializers.Serializer, 'to_representation'):
+        return serializer.to_representation
+
+    model = getattr(getattr(serializer, 'Meta', None), 'model', None)
+    steps = []
+    for field in serializer._readable_fields:
+        if isinstance(field, serializers.SerializerMethodField):
+            steps.append((field.field_name, lambda instance: instance, getattr(serializer, field.method_name)))
+            continue
+        if isinstance(field, serializers.ListSerializer) and \
+                not _overrides(field, serializers.ListSerializer, 'to_representation'):
+            to_representation = _compile_list(field)
+        elif isinstance(field, serializers.Serializer):
+            to_representation = compile_serializer(field)
+        else:
+            to_representation = field.to_representation
+        steps.append((field.field_name, _compile_getter(field, model), to_representation))
+
+    def represent(instance):
+        ret = OrderedDict()
+        for field_name, get, to_representation in steps:
+            try:
+                attribute = get(instance)
+            except SkipField:
+                continue
+            ret[field_name] = None if attribute is None else to_representation(attribute)
+        return ret
+    return represent
+
+
+class CompiledListSerializer(serializers.ListSerializer):
+    """
+    Read only list serializer that compiles its child once instead of walking its fields for every item.
+    """
+
+    def to_representation(self, data):
+        return _compile_list(self)(data)
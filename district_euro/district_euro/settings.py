@@ -61,6 +61,7 @@ MIDDLEWARE_CLASSES = [
     'django.contrib.auth.middleware.SessionAuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.DeferTranslationsMiddleware',
 ]
 
 ROOT_URLCONF = 'district_euro.urls'
@@ -164,13 +165,13 @@ STATIC_URL = '/static/'
 REST_FRAMEWORK = {
     'UNICODE_JSON': False,
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_jwt.authentication.JSONWebTokenAuthentication',
+        'core.rest.auth.authentication.JSONWebTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
     'DEFAULT_RENDERER_CLASSES': (
-        'rest_framework.renderers.JSONRenderer',
+        'core.renderers.UTF8JSONRenderer',
     ),
     'PAGE_SIZE': 20,
     'EXCEPTION_HANDLER': 'core.exception_handler.core_exception_handler',
@@ -192,7 +193,7 @@ JWT_AUTH = {
         'rest_framework_jwt.utils.jwt_decode_handler',
 
     'JWT_PAYLOAD_HANDLER':
-        'rest_framework_jwt.utils.jwt_payload_handler',
+        'core.rest.auth.utils.jwt_payload_handler',
 
     'JWT_PAYLOAD_GET_USER_ID_HANDLER':
         'rest_framework_jwt.utils.jwt_get_user_id_from_payload_handler',
@@ -269,6 +270,16 @@ LOGGING = {
     },
     'handlers': {
         'db': {
+            'level': 'DEBUG',
+            'class': 'core.logger.QueuedDistrictEuroLoggingHandler',
+            'formatter': 'verbose',
+            # Max records waiting to be saved, oldest are dropped when full.
+            'capacity': 10000,
+            # Records are saved every batch_size records or flush_interval milliseconds.
+            'batch_size': 100,
+            'flush_interval': 1000,
+        } if not IS_TESTING else {
+            # Tests run inside transactions, logs are saved synchronously to be rolled back with them.
             'level': 'DEBUG',
             'class': 'core.logger.DistrictEuroLoggingHandler',
             'formatter': 'verbose',
@@ -283,6 +294,12 @@ LOGGING = {
     },
 }
 
+# Days system logs are kept, older ones are deleted by the purge_system_logs command.
+SYSTEM_LOG_RETENTION_DAYS = 90
+
+# Addresses notified of new join requests, none are emailed while it is empty.
+JOIN_REQUEST_EMAILS = []
+
 # i18n
 
 LOCALE_PATHS = [
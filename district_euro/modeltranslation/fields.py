@@ -2,7 +2,8 @@
 from django import VERSION
 from django import forms
 from django.core.exceptions import ImproperlyConfigured
-from django.db.models import fields
+from django.db.models import F, Func, Value, fields
+from django.db.models.functions import Coalesce
 from django.utils import six
 
 from modeltranslation import settings as mt_settings
@@ -291,6 +292,11 @@ class TranslationField(object):
         return (field_class, args, kwargs)
 
 
+class NullIf(Func):
+    function = 'NULLIF'
+    arity = 2
+
+
 class TranslationFieldDescriptor(object):
     """
     A descriptor used for the original translated field.
@@ -305,6 +311,72 @@ class TranslationFieldDescriptor(object):
         self.fallback_languages = fallback_languages
         self.fallback_value = fallback_value
         self.fallback_undefined = fallback_undefined
+        self._is_file = isinstance(field, fields.files.FileField)
+        # Default is only computed once unless it is a callable.
+        self._static_default = NONE if field.has_default() and callable(field.default) else field.get_default()
+        # Attribute names to look for a value in, in order, by active language.
+        self._localized_names = dict(
+            (lang, (build_localized_fieldname(field.name, lang),)) for lang in mt_settings.AVAILABLE_LANGUAGES)
+        self._fallback_names = {}
+        self._fallback_settings = None
+        if mt_settings.ENABLE_FALLBACKS:
+            self._build_fallback_names()
+
+    def _build_fallback_names(self):
+        """
+        Precomputes the attribute names every language falls back to. Rebuilt if fallback settings are reloaded.
+        """
+        self._fallback_settings = mt_settings.FALLBACK_LANGUAGES
+        self._fallback_names = dict(
+            (lang, tuple(build_localized_fieldname(self.field.name, l)
+                         for l in resolution_order(lang, self.fallback_languages)))
+            for lang in mt_settings.AVAILABLE_LANGUAGES)
+
+    def resolution_names(self, lang):
+        """
+        Returns localized attribute names checked for a value, in order, when lang is active.
+        """
+        if not mt_settings.ENABLE_FALLBACKS:
+            names = self._localized_names.get(lang)
+            if names is None:
+                names = self._localized_names[lang] = (build_localized_fieldname(self.field.name, lang),)
+            return names
+        if self._fallback_settings is not mt_settings.FALLBACK_LANGUAGES:
+            self._build_fallback_names()
+        names = self._fallback_names.get(lang)
+        if names is None:
+            names = self._fallback_names[lang] = tuple(
+                build_localized_fieldname(self.field.name, l) for l in resolution_order(lang, self.fallback_languages))
+        return names
+
+    def fallback_expression(self, lang, prefix=''):
+        """
+        Returns an expression resolving the value for lang in the database like ``__get__`` does, e.g.
+        ``COALESCE(NULLIF(name_es, ''), NULLIF(name_en, ''), '')``, or None when it can't be done in SQL.
+
+        ``prefix`` is the lookup path to the model when querying another one, e.g. ``'product__'``.
+        """
+        if self.field.is_relation or self._is_file:
+            return None
+        undefined = self.fallback_undefined
+        if undefined is NONE:
+            undefined = self._static_default
+        default = self.fallback_value if mt_settings.ENABLE_FALLBACKS and self.fallback_value is not NONE \
+            else self._static_default
+        if undefined is NONE or default is NONE:
+            # Callable defaults
+            return None
+        expressions = []
+        for loc_field_name in self.resolution_names(lang):
+            expression = F(prefix + loc_field_name)
+            if undefined is not None:
+                expression = NullIf(expression, Value(undefined), output_field=self.field)
+            expressions.append(expression)
+        if default is not None:
+            expressions.append(Value(default, output_field=self.field))
+        if len(expressions) == 1:
+            return expressions[0]
+        return Coalesce(*expressions, output_field=self.field)
 
     def __set__(self, instance, value):
         """
@@ -338,16 +410,18 @@ class TranslationFieldDescriptor(object):
         """
         if instance is None:
             return self
-        default = NONE
+        default = self._static_default
         undefined = self.fallback_undefined
         if undefined is NONE:
-            default = self.field.get_default()
+            if default is NONE:
+                default = self.field.get_default()
             undefined = default
-        langs = resolution_order(get_language(), self.fallback_languages)
-        for lang in langs:
-            loc_field_name = build_localized_fieldname(self.field.name, lang)
+        for loc_field_name in self.resolution_names(get_language()):
             val = getattr(instance, loc_field_name, None)
-            if self.meaningful_value(val, undefined):
+            if self._is_file:
+                if self.meaningful_value(val, undefined):
+                    return val
+            elif val is not None and val != undefined:
                 return val
         if mt_settings.ENABLE_FALLBACKS and self.fallback_value is not NONE:
             return self.fallback_value
@@ -358,8 +432,7 @@ class TranslationFieldDescriptor(object):
             # instance of attr_class, but rather None or ''.
             # Normally this case is handled in the descriptor, but since we have overridden it, we
             # must mock it up.
-            if (isinstance(self.field, fields.files.FileField) and
-                    not isinstance(default, self.field.attr_class)):
+            if self._is_file and not isinstance(default, self.field.attr_class):
                 return self.field.attr_class(instance, self.field, default)
             return default
 
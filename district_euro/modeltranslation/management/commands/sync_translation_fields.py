@@ -57,11 +57,15 @@ class Command(BaseCommand):
         option_list = BaseCommand.option_list + (
             make_option('--noinput', action='store_false', dest='interactive', default=True,
                         help='Do NOT prompt the user for input of any kind.'),
+            make_option('--dry-run', action='store_true', dest='dry_run', default=False,
+                        help='Only print the SQL that would be executed.'),
         )
     else:
         def add_arguments(self, parser):
             parser.add_argument('--noinput', action='store_false', dest='interactive', default=True,
                                 help='Do NOT prompt the user for input of any kind.'),
+            parser.add_argument('--dry-run', action='store_true', dest='dry_run', default=False,
+                                help='Only print the SQL that would be executed.')
 
     def handle(self, *args, **options):
         """
@@ -70,6 +74,7 @@ class Command(BaseCommand):
         self.cursor = connection.cursor()
         self.introspection = connection.introspection
         self.interactive = options['interactive']
+        self.dry_run = options.get('dry_run', False)
 
         found_missing_fields = False
         models = translator.get_registered_models(abstract=False)
@@ -81,24 +86,38 @@ class Command(BaseCommand):
                 model_name = model._meta.model_name
             model_full_name = '%s.%s' % (model._meta.app_label, model_name)
             opts = translator.get_options_for_model(model)
+            # Table is introspected once for all its fields.
+            db_table_fields = self.get_table_fields(db_table)
+            sql_sentences = []
             for field_name, fields in opts.local_fields.items():
+                if not fields:
+                    # Translation fields of this field live in a parent table.
+                    continue
                 # Take `db_column` attribute into account
                 field = list(fields)[0]
                 column_name = field.db_column if field.db_column else field_name
-                missing_langs = list(self.get_missing_languages(column_name, db_table))
+                missing_langs = list(self.get_missing_languages(column_name, db_table, db_table_fields))
                 if missing_langs:
-                    found_missing_fields = True
                     print_missing_langs(missing_langs, field_name, model_full_name)
-                    sql_sentences = self.get_sync_sql(field_name, missing_langs, model)
-                    execute_sql = ask_for_confirmation(
-                        sql_sentences, model_full_name, self.interactive)
-                    if execute_sql:
-                        print('Executing SQL...')
-                        for sentence in sql_sentences:
-                            self.cursor.execute(sentence)
-                        print('Done')
-                    else:
-                        print('SQL not executed')
+                    sql_sentences.extend(self.get_sync_sql(field_name, missing_langs, model))
+            if sql_sentences:
+                found_missing_fields = True
+                if self.dry_run:
+                    print('\nSQL to synchronize "%s" schema:' % model_full_name)
+                    for sentence in sql_sentences:
+                        print('   %s' % sentence)
+                    print('SQL not executed, dry run')
+                    continue
+                # All columns of a model are added at once.
+                execute_sql = ask_for_confirmation(
+                    sql_sentences, model_full_name, self.interactive)
+                if execute_sql:
+                    print('Executing SQL...')
+                    for sentence in sql_sentences:
+                        self.cursor.execute(sentence)
+                    print('Done')
+                else:
+                    print('SQL not executed')
 
         if django.VERSION < (1, 6):
             transaction.commit_unless_managed()
@@ -113,11 +132,12 @@ class Command(BaseCommand):
         db_table_desc = self.introspection.get_table_description(self.cursor, db_table)
         return [t[0] for t in db_table_desc]
 
-    def get_missing_languages(self, field_name, db_table):
+    def get_missing_languages(self, field_name, db_table, db_table_fields=None):
         """
         Gets only missings fields.
         """
-        db_table_fields = self.get_table_fields(db_table)
+        if db_table_fields is None:
+            db_table_fields = self.get_table_fields(db_table)
         for lang_code in AVAILABLE_LANGUAGES:
             if build_localized_fieldname(field_name, lang_code) not in db_table_fields:
                 yield lang_code
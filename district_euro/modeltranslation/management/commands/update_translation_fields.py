@@ -1,5 +1,13 @@
 # -*- coding: utf-8 -*-
-from django.db.models import F, Q
+import json
+import os
+import threading
+import time
+from multiprocessing.pool import ThreadPool
+
+from django import VERSION
+from django.db import connection
+from django.db.models import Case, F, Max, Min, Q, When
 from django.core.management.base import BaseCommand
 
 from modeltranslation.settings import DEFAULT_LANGUAGE
@@ -7,27 +15,165 @@ from modeltranslation.translator import translator
 from modeltranslation.utils import build_localized_fieldname
 
 
+def model_label(model):
+    return '%s.%s' % (model._meta.app_label, model._meta.object_name)
+
+
 class Command(BaseCommand):
     help = ('Updates empty values of default translation fields using'
             ' values from original fields (in all translated models).')
 
+    if VERSION < (1, 8):
+        from optparse import make_option
+        option_list = BaseCommand.option_list + (
+            make_option('--batch-size', type='int', dest='batch_size', default=0,
+                        help='Update rows by primary key ranges of this size. By default the whole table is '
+                             'updated with one statement.'),
+            make_option('--sleep', type='float', dest='sleep', default=0,
+                        help='Seconds to wait between batches.'),
+            make_option('--dry-run', action='store_true', dest='dry_run', default=False,
+                        help='Only report how many rows would be updated.'),
+            make_option('--jobs', type='int', dest='jobs', default=1,
+                        help='Amount of models updated at the same time.'),
+            make_option('--state-file', dest='state_file', default=None,
+                        help='File where progress is saved, an interrupted run started again with the same file '
+                             'continues where it stopped.'),
+        )
+    else:
+        def add_arguments(self, parser):
+            parser.add_argument('--batch-size', type=int, dest='batch_size', default=0,
+                                help='Update rows by primary key ranges of this size. By default the whole table '
+                                     'is updated with one statement.')
+            parser.add_argument('--sleep', type=float, dest='sleep', default=0,
+                                help='Seconds to wait between batches.')
+            parser.add_argument('--dry-run', action='store_true', dest='dry_run', default=False,
+                                help='Only report how many rows would be updated.')
+            parser.add_argument('--jobs', type=int, dest='jobs', default=1,
+                                help='Amount of models updated at the same time.')
+            parser.add_argument('--state-file', dest='state_file', default=None,
+                                help='File where progress is saved, an interrupted run started again with the same '
+                                     'file continues where it stopped.')
+
     def handle(self, *args, **options):
-        verbosity = int(options['verbosity'])
-        if verbosity > 0:
+        self.verbosity = int(options['verbosity'])
+        self.batch_size = options['batch_size']
+        self.sleep = options['sleep']
+        self.dry_run = options['dry_run']
+        self.state_file = options['state_file']
+        self.state = self.load_state()
+        self.lock = threading.Lock()
+
+        if self.verbosity > 0:
             self.stdout.write("Using default language: %s\n" % DEFAULT_LANGUAGE)
         models = translator.get_registered_models(abstract=False)
-        for model in models:
-            if verbosity > 0:
-                self.stdout.write("Updating data of model '%s'\n" % model)
-            opts = translator.get_options_for_model(model)
-            for field_name in opts.fields.keys():
-                def_lang_fieldname = build_localized_fieldname(field_name, DEFAULT_LANGUAGE)
-
-                # We'll only update fields which do not have an existing value
-                q = Q(**{def_lang_fieldname: None})
-                field = model._meta.get_field(field_name)
-                if field.empty_strings_allowed:
-                    q |= Q(**{def_lang_fieldname: ""})
-
-                model._default_manager.filter(q).rewrite(False).update(
-                    **{def_lang_fieldname: F(field_name)})
+        jobs = max(options['jobs'], 1)
+        if jobs == 1:
+            for model in models:
+                self.update_model(model)
+        else:
+            pool = ThreadPool(jobs)
+            try:
+                # get() re-raises errors of the workers.
+                pool.map_async(self.update_model_in_thread, models).get(2 ** 31)
+            finally:
+                pool.terminate()
+
+        if self.state_file and not self.dry_run and os.path.exists(self.state_file):
+            # Everything was updated, next run starts from scratch.
+            os.remove(self.state_file)
+
+    def load_state(self):
+        if not self.state_file or not os.path.exists(self.state_file):
+            return {}
+        with open(self.state_file) as f:
+            return json.load(f)
+
+    def save_state(self, model, last_pk):
+        """
+        Records every row of model up to last_pk is updated, None when the whole model is.
+        """
+        if not self.state_file or self.dry_run:
+            return
+        with self.lock:
+            self.state[model_label(model)] = {'done': last_pk is None, 'last_pk': last_pk}
+            tmp_file = self.state_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                json.dump(self.state, f)
+            os.rename(tmp_file, self.state_file)
+
+    def write(self, message):
+        with self.lock:
+            self.stdout.write(message)
+
+    def update_model_in_thread(self, model):
+        try:
+            self.update_model(model)
+        finally:
+            # Every thread opens its own connection.
+            connection.close()
+
+    def get_update(self, model):
+        """
+        Returns the filter of rows with some empty default translation field and the values to update them with,
+        so all fields of a model are updated with one statement.
+        """
+        opts = translator.get_options_for_model(model)
+        empty = Q()
+        values = {}
+        for field_name in opts.fields.keys():
+            def_lang_fieldname = build_localized_fieldname(field_name, DEFAULT_LANGUAGE)
+
+            # We'll only update fields which do not have an existing value
+            q = Q(**{def_lang_fieldname: None})
+            field = model._meta.get_field(field_name)
+            if field.empty_strings_allowed:
+                q |= Q(**{def_lang_fieldname: ""})
+
+            empty |= q
+            values[def_lang_fieldname] = Case(When(q, then=F(field_name)), default=F(def_lang_fieldname),
+                                              output_field=model._meta.get_field(def_lang_fieldname))
+        return empty, values
+
+    def update_model(self, model):
+        state = self.state.get(model_label(model), {})
+        if state.get('done'):
+            if self.verbosity > 0:
+                self.write("Skipping model '%s', already updated\n" % model)
+            return
+        if self.verbosity > 0:
+            self.write("Updating data of model '%s'\n" % model)
+
+        empty, values = self.get_update(model)
+        queryset = model._default_manager.rewrite(False).filter(empty)
+        pk_field = model._meta.pk
+
+        if not self.batch_size or pk_field.get_internal_type() not in ('AutoField', 'BigAutoField'):
+            if self.dry_run:
+                updated = queryset.count()
+            else:
+                updated = queryset.update(**values)
+            self.save_state(model, None)
+            if self.verbosity > 0:
+                self.write("%s %d rows of model '%s'\n" % (self.verb(), updated, model))
+            return
+
+        bounds = model._default_manager.rewrite(False).aggregate(first=Min('pk'), last=Max('pk'))
+        start = state.get('last_pk') or (bounds['first'] or 1) - 1
+        total = 0
+        while bounds['last'] is not None and start < bounds['last']:
+            end = min(start + self.batch_size, bounds['last'])
+            batch = queryset.filter(pk__gt=start, pk__lte=end)
+            updated = batch.count() if self.dry_run else batch.update(**values)
+            total += updated
+            self.save_state(model, end)
+            if self.verbosity > 1:
+                self.write("%s %d rows of model '%s' with pk up to %d\n" % (self.verb(), updated, model, end))
+            start = end
+            if self.sleep and start < bounds['last']:
+                time.sleep(self.sleep)
+        self.save_state(model, None)
+        if self.verbosity > 0:
+            self.write("%s %d rows of model '%s'\n" % (self.verb(), total, model))
+
+    def verb(self):
+        return 'Would update' if self.dry_run else 'Updated'
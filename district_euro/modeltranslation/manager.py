@@ -21,7 +21,7 @@ try:
     from django.db.models.sql.where import Constraint
     NEW_RELATED_API = False
 except ImportError:
-    from django.db.models.query import ValuesIterable
+    from django.db.models.query import ModelIterable, ValuesIterable, ValuesListIterable, FlatValuesListIterable
     NEW_RELATED_API = True  # Django 1.9
 
 from django.utils.six import moves
@@ -34,9 +34,9 @@ except ImportError:
     NEW_LOOKUPS = False
 
 from modeltranslation import settings
-from modeltranslation.fields import TranslationField
+from modeltranslation.fields import TranslationField, TranslationFieldDescriptor
 from modeltranslation.utils import (build_localized_fieldname, get_language,
-                                    auto_populate, resolution_order)
+                                    auto_populate, resolution_order, translations_deferred)
 
 
 def get_translatable_fields_for_model(model):
@@ -47,7 +47,44 @@ def get_translatable_fields_for_model(model):
         return None
 
 
+# Rewritten lookups only depend on the registry, the active language and, for fallbacks, on fallbacks being
+# enabled, so they are computed once per combination. Translator clears them when registrations change.
+_LOOKUP_CACHE_SIZE = 10000
+_REWRITE_CACHE = {}
+_FALLBACK_CACHE = {}
+_fallback_settings = None
+_LOOKUP_KEY_CACHE = {}
+_DEFERRABLE_CACHE = {}
+
+
+def clear_lookup_caches():
+    """
+    Forgets all rewritten lookups, must be called whenever a model is registered or unregistered.
+    """
+    _REWRITE_CACHE.clear()
+    _FALLBACK_CACHE.clear()
+    _LOOKUP_KEY_CACHE.clear()
+    _DEFERRABLE_CACHE.clear()
+    _F2TM_CACHE.clear()
+
+
+def _cache_set(cache, key, value):
+    # Lookups may come from user input, keep the caches bounded.
+    if len(cache) >= _LOOKUP_CACHE_SIZE:
+        cache.clear()
+    cache[key] = value
+    return value
+
+
 def rewrite_lookup_key(model, lookup_key):
+    lang = get_language()
+    try:
+        return _REWRITE_CACHE[(model, lookup_key, lang)]
+    except KeyError:
+        return _cache_set(_REWRITE_CACHE, (model, lookup_key, lang), _rewrite_lookup_key(model, lookup_key, lang))
+
+
+def _rewrite_lookup_key(model, lookup_key, lang):
     pieces = lookup_key.split('__', 1)
     original_key = pieces[0]
 
@@ -57,7 +94,7 @@ def rewrite_lookup_key(model, lookup_key):
         # we want to rewrite it to the actual field name
         # For example, we want to rewrite "name__startswith" to "name_fr__startswith"
         if pieces[0] in translatable_fields:
-            pieces[0] = build_localized_fieldname(pieces[0], get_language())
+            pieces[0] = build_localized_fieldname(pieces[0], lang)
 
     if len(pieces) > 1:
         # Check if we are doing a lookup to a related trans model
@@ -74,17 +111,32 @@ def append_fallback(model, fields):
     If translated field is encountered, add also all its fallback fields.
     Returns tuple: (set_of_new_fields_to_use, set_of_translated_field_names)
     """
+    global _fallback_settings
+    if _fallback_settings is not settings.FALLBACK_LANGUAGES:
+        # Fallback settings were reloaded.
+        _FALLBACK_CACHE.clear()
+        _fallback_settings = settings.FALLBACK_LANGUAGES
+    fields = tuple(fields)
+    cache_key = (model, fields, get_language(), settings.ENABLE_FALLBACKS)
+    try:
+        new_fields, trans = _FALLBACK_CACHE[cache_key]
+    except KeyError:
+        new_fields, trans = _cache_set(_FALLBACK_CACHE, cache_key, _append_fallback(model, fields, cache_key[2]))
+    return set(new_fields), set(trans)
+
+
+def _append_fallback(model, fields, lang):
     fields = set(fields)
     trans = set()
     from modeltranslation.translator import translator
     opts = translator.get_options_for_model(model)
     for key, _ in opts.fields.items():
         if key in fields:
-            langs = resolution_order(get_language(), getattr(model, key).fallback_languages)
-            fields = fields.union(build_localized_fieldname(key, lang) for lang in langs)
+            langs = resolution_order(lang, getattr(model, key).fallback_languages)
+            fields = fields.union(build_localized_fieldname(key, l) for l in langs)
             fields.remove(key)
             trans.add(key)
-    return fields, trans
+    return frozenset(fields), frozenset(trans)
 
 
 def append_translated(model, fields):
@@ -100,6 +152,13 @@ def append_translated(model, fields):
 
 def append_lookup_key(model, lookup_key):
     "Transform spanned__lookup__key into all possible translation versions, on all levels"
+    try:
+        return set(_LOOKUP_KEY_CACHE[(model, lookup_key)])
+    except KeyError:
+        return set(_cache_set(_LOOKUP_KEY_CACHE, (model, lookup_key), _append_lookup_key(model, lookup_key)))
+
+
+def _append_lookup_key(model, lookup_key):
     pieces = lookup_key.split('__', 1)
 
     fields = append_translated(model, (pieces[0],))
@@ -113,7 +172,33 @@ def append_lookup_key(model, lookup_key):
             fields = set('__'.join(pr) for pr in itertools.product(fields, rest))
         else:
             fields = set('%s__%s' % (f, pieces[1]) for f in fields)
-    return fields
+    return frozenset(fields)
+
+
+def get_deferrable_translation_fields(model):
+    """
+    Returns names of the translation columns of model not needed to read its translated fields in the active
+    language: other languages and the original field. Relations are never deferred.
+    """
+    cache_key = (model, get_language(), settings.ENABLE_FALLBACKS)
+    try:
+        return _DEFERRABLE_CACHE[cache_key]
+    except KeyError:
+        pass
+    from modeltranslation.translator import NotRegistered, translator
+    names = []
+    try:
+        opts = translator.get_options_for_model(model)
+    except NotRegistered:
+        opts = None
+    for field_name, translation_fields in (opts.fields.items() if opts else ()):
+        descriptor = getattr(model, field_name, None)
+        if not hasattr(descriptor, 'resolution_names') or descriptor.field.is_relation:
+            continue
+        needed = descriptor.resolution_names(cache_key[1])
+        names.append(field_name)
+        names.extend(f.name for f in translation_fields if f.name not in needed)
+    return _cache_set(_DEFERRABLE_CACHE, cache_key, tuple(names))
 
 
 def append_lookup_keys(model, fields):
@@ -187,6 +272,8 @@ class MultilingualQuerySet(models.query.QuerySet):
     def _post_init(self):
         self._rewrite = True
         self._populate = None
+        self._sql_fallbacks = False
+        self._defer_translations = None
         if self.model and (not self.query.order_by):
             if self.model._meta.ordering:
                 # If we have default ordering specified on the model, set it now so that
@@ -204,6 +291,8 @@ class MultilingualQuerySet(models.query.QuerySet):
         def _clone(self, klass=None, **kwargs):
             kwargs.setdefault('_rewrite', self._rewrite)
             kwargs.setdefault('_populate', self._populate)
+            kwargs.setdefault('_sql_fallbacks', self._sql_fallbacks)
+            kwargs.setdefault('_defer_translations', self._defer_translations)
             if hasattr(self, 'translation_fields'):
                 kwargs.setdefault('translation_fields', self.translation_fields)
             if hasattr(self, 'fields_to_del'):
@@ -233,6 +322,96 @@ class MultilingualQuerySet(models.query.QuerySet):
         """
         return self._clone(_populate=mode)
 
+    # This method was not present in django-linguo
+    def sql_fallbacks(self, mode=True):
+        """
+        Resolves translation fallbacks of the model fields in the database instead of in Python.
+
+        Filtering, ordering and ``values``/``values_list`` on a translated field use a COALESCE over the fallback
+        languages columns, so rows missing a translation are matched and sorted by their fallback value and only the
+        resolved value is fetched. Lookups spanning relations keep using the active language column.
+        """
+        if not NEW_RELATED_API:
+            return self
+        return self._clone(_sql_fallbacks=mode)
+
+    # This method was not present in django-linguo
+    def defer_translations(self, mode=True):
+        """
+        Defers translation columns of languages the active language does not fall back to, and the original
+        columns, when the query set is evaluated. Reading one of them loads all the deferred ones at once.
+
+        By default follows ``modeltranslation.utils.defer_translations``.
+        """
+        return self._clone(_defer_translations=mode)
+
+    def _deferred_translation_fields(self, model, select_related, prefix=''):
+        names = [prefix + name for name in get_deferrable_translation_fields(model)]
+        if isinstance(select_related, dict):
+            for field_name, nested in select_related.items():
+                try:
+                    field = model._meta.get_field(field_name)
+                except FieldDoesNotExist:
+                    continue
+                if field.related_model is not None:
+                    names.extend(self._deferred_translation_fields(
+                        field.related_model, nested, '%s%s__' % (prefix, field_name)))
+        return names
+
+    def _apply_deferred_translations(self):
+        mode = self._defer_translations
+        if not (translations_deferred() if mode is None else mode):
+            return
+        if NEW_RELATED_API and self._iterable_class is not ModelIterable:
+            # values() and friends select their own columns
+            return
+        deferred, defer = self.query.deferred_loading
+        if not defer:
+            # only() chose the columns
+            return
+        names = self._deferred_translation_fields(self.model, self.query.select_related)
+        if names:
+            self.query = self.query.clone()
+            self.query.add_deferred_loading(names)
+
+    def _fetch_all(self):
+        if self._result_cache is None:
+            self._apply_deferred_translations()
+        super(MultilingualQuerySet, self)._fetch_all()
+
+    def iterator(self):
+        self._apply_deferred_translations()
+        return super(MultilingualQuerySet, self).iterator()
+
+    def _add_fallback_annotation(self, field_name):
+        """
+        Annotates the query with the fallback expression of field_name, under the same name and masked out of the
+        SELECT clause. Returns False if field_name is not a translated field that can fall back in the database.
+        """
+        query = self.query
+        if field_name in query.annotations:
+            return True
+        descriptor = getattr(self.model, field_name, None)
+        if not isinstance(descriptor, TranslationFieldDescriptor):
+            return False
+        expression = descriptor.fallback_expression(get_language())
+        if expression is None:
+            return False
+        selected = list(query.annotation_select)
+        query.add_annotation(expression, field_name)
+        query.set_annotation_mask(selected)
+        return True
+
+    def _rewrite_key(self, lookup_key):
+        if self._sql_fallbacks and self._add_fallback_annotation(lookup_key.split('__', 1)[0]):
+            return lookup_key
+        return rewrite_lookup_key(self.model, lookup_key)
+
+    def _rewrite_order_key(self, lookup_key):
+        if lookup_key.startswith('-'):
+            return '-' + self._rewrite_key(lookup_key[1:])
+        return self._rewrite_key(lookup_key)
+
     def _rewrite_applied_operations(self):
         """
         Rewrite fields in already applied filters/ordering.
@@ -305,7 +484,7 @@ class MultilingualQuerySet(models.query.QuerySet):
     def _rewrite_q(self, q):
         """Rewrite field names inside Q call."""
         if isinstance(q, tuple) and len(q) == 2:
-            return rewrite_lookup_key(self.model, q[0]), q[1]
+            return self._rewrite_key(q[0]), q[1]
         if isinstance(q, Node):
             q.children = list(map(self._rewrite_q, q.children))
         return q
@@ -330,12 +509,14 @@ class MultilingualQuerySet(models.query.QuerySet):
     def _filter_or_exclude(self, negate, *args, **kwargs):
         if not self._rewrite:
             return super(MultilingualQuerySet, self)._filter_or_exclude(negate, *args, **kwargs)
-        args = map(self._rewrite_q, args)
+        # Fallback annotations are added to the query, do not modify this queryset.
+        qs = self._clone() if self._sql_fallbacks else self
+        args = map(qs._rewrite_q, args)
         for key, val in list(kwargs.items()):
-            new_key = rewrite_lookup_key(self.model, key)
+            new_key = qs._rewrite_key(key)
             del kwargs[key]
-            kwargs[new_key] = self._rewrite_f(val)
-        return super(MultilingualQuerySet, self)._filter_or_exclude(negate, *args, **kwargs)
+            kwargs[new_key] = qs._rewrite_f(val)
+        return super(MultilingualQuerySet, qs)._filter_or_exclude(negate, *args, **kwargs)
 
     def _get_original_fields(self):
         source = (self.model._meta.concrete_fields if hasattr(self.model._meta, 'concrete_fields')
@@ -349,10 +530,31 @@ class MultilingualQuerySet(models.query.QuerySet):
         """
         if not self._rewrite:
             return super(MultilingualQuerySet, self).order_by(*field_names)
+        qs = self._clone() if self._sql_fallbacks else self
         new_args = []
         for key in field_names:
-            new_args.append(rewrite_order_lookup_key(self.model, key))
-        return super(MultilingualQuerySet, self).order_by(*new_args)
+            new_args.append(qs._rewrite_order_key(key))
+        return super(MultilingualQuerySet, qs).order_by(*new_args)
+
+    def distinct(self, *field_names):
+        """
+        Change translatable field names in a ``distinct`` argument to
+        translation fields for the current language, as ``order_by`` does.
+
+        Fields resolved by ``sql_fallbacks`` can not be used, DISTINCT ON
+        only takes model fields.
+        """
+        if not self._rewrite or not field_names:
+            return super(MultilingualQuerySet, self).distinct(*field_names)
+        if self._sql_fallbacks:
+            for key in field_names:
+                descriptor = getattr(self.model, key.split('__', 1)[0], None)
+                if isinstance(descriptor, TranslationFieldDescriptor) and \
+                        descriptor.fallback_expression(get_language()) is not None:
+                    raise ValueError("distinct('%s') is not supported with sql_fallbacks(), the fallback value is "
+                                     "not a column. Use distinct() or sql_fallbacks(False)." % key)
+        return super(MultilingualQuerySet, self).distinct(
+            *[rewrite_lookup_key(self.model, key) for key in field_names])
 
     def update(self, **kwargs):
         if not self._rewrite:
@@ -405,8 +607,21 @@ class MultilingualQuerySet(models.query.QuerySet):
     def _values(self, *original, **kwargs):
         if not kwargs.get('prepare', False):
             return super(MultilingualQuerySet, self)._values(*original)
-        new_fields, translation_fields = append_fallback(self.model, original)
-        clone = super(MultilingualQuerySet, self)._values(*list(new_fields))
+        qs = self
+        sql_fields = set()
+        if self._sql_fallbacks:
+            qs = self._clone()
+            for field_name in original:
+                if qs._add_fallback_annotation(field_name):
+                    qs.query.append_annotation_mask([field_name])
+                    sql_fields.add(field_name)
+        new_fields, translation_fields = append_fallback(self.model, [f for f in original if f not in sql_fields])
+        new_fields |= sql_fields
+        if not translation_fields:
+            # Nothing left to resolve in Python, keep the requested order.
+            clone = super(MultilingualQuerySet, qs)._values(*original)
+        else:
+            clone = super(MultilingualQuerySet, qs)._values(*list(new_fields))
         clone.original_fields = tuple(original)
         clone.translation_fields = translation_fields
         clone.fields_to_del = new_fields - set(original)
@@ -421,7 +636,7 @@ class MultilingualQuerySet(models.query.QuerySet):
             fields = self._get_original_fields()
         if NEW_RELATED_API:
             clone = self._values(*fields, prepare=True)
-            clone._iterable_class = FallbackValuesIterable
+            clone._iterable_class = FallbackValuesIterable if clone.translation_fields else ValuesIterable
             return clone
         else:
             return self._clone(klass=FallbackValuesQuerySet, setup=True, _fields=fields)
@@ -441,8 +656,11 @@ class MultilingualQuerySet(models.query.QuerySet):
             fields = self._get_original_fields()
         if NEW_RELATED_API:
             clone = self._values(*fields, prepare=True)
-            clone._iterable_class = (FallbackFlatValuesListIterable if flat
-                                     else FallbackValuesListIterable)
+            if clone.translation_fields:
+                clone._iterable_class = (FallbackFlatValuesListIterable if flat
+                                         else FallbackValuesListIterable)
+            else:
+                clone._iterable_class = FlatValuesListIterable if flat else ValuesListIterable
             return clone
         else:
             return self._clone(klass=FallbackValuesListQuerySet, setup=True, flat=flat,
@@ -587,6 +805,12 @@ class MultilingualManager(MultilingualQuerysetManager):
     def populate(self, *args, **kwargs):
         return self.get_queryset().populate(*args, **kwargs)
 
+    def sql_fallbacks(self, *args, **kwargs):
+        return self.get_queryset().sql_fallbacks(*args, **kwargs)
+
+    def defer_translations(self, *args, **kwargs):
+        return self.get_queryset().defer_translations(*args, **kwargs)
+
     def raw_values(self, *args, **kwargs):
         return self.get_queryset().raw_values(*args, **kwargs)
 
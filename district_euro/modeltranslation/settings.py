@@ -54,3 +54,6 @@ for key, value in FALLBACK_LANGUAGES.items():
 ENABLE_FALLBACKS = getattr(settings, 'MODELTRANSLATION_ENABLE_FALLBACKS', True)
 
 LOADDATA_RETAIN_LOCALE = getattr(settings, 'MODELTRANSLATION_LOADDATA_RETAIN_LOCALE', True)
+
+# Defer translation columns of languages the active language does not fall back to.
+DEFER_TRANSLATIONS = getattr(settings, 'MODELTRANSLATION_DEFER_TRANSLATIONS', False)
@@ -4,6 +4,7 @@ from decimal import Decimal
 import imp
 import os
 import shutil
+import tempfile
 
 import django
 from django import forms
@@ -2006,6 +2007,20 @@ class UpdateCommandTest(ModeltranslationTestBase):
         self.assertEqual('initial', obj1.title_de)
         self.assertEqual('already', obj2.title_de)
 
+    def test_update_command_batches(self):
+        pks = [models.TestModel.objects.create(title_de='').pk for i in range(3)]
+        already_pk = models.TestModel.objects.create(title_de='already').pk
+        models.TestModel.objects.all().rewrite(False).update(title='initial')
+
+        call_command('update_translation_fields', verbosity=0, dry_run=True, batch_size=2)
+        self.assertEqual(3, models.TestModel.objects.filter(pk__in=pks, title_de='').count())
+
+        state_file = os.path.join(tempfile.mkdtemp(), 'update_translation_fields.json')
+        call_command('update_translation_fields', verbosity=0, batch_size=2, state_file=state_file)
+        self.assertEqual(3, models.TestModel.objects.filter(pk__in=pks, title_de='initial').count())
+        self.assertEqual('already', models.TestModel.objects.get(pk=already_pk).title_de)
+        self.assertFalse(os.path.exists(state_file))
+
 
 class TranslationAdminTest(ModeltranslationTestBase):
     def setUp(self):
@@ -2446,6 +2461,57 @@ class TestManager(ModeltranslationTestBase):
         super(TestManager, self).setUp()
         trans_real.activate('en')
 
+    def test_lookup_cache(self):
+        """Test if cached lookup rewrites follow the active language."""
+        from modeltranslation.manager import rewrite_lookup_key
+        self.assertEqual('title_en__contains', rewrite_lookup_key(models.ManagerTestModel, 'title__contains'))
+        with override('de'):
+            self.assertEqual('title_de__contains', rewrite_lookup_key(models.ManagerTestModel, 'title__contains'))
+        self.assertEqual('title_en__contains', rewrite_lookup_key(models.ManagerTestModel, 'title__contains'))
+
+    def test_sql_fallbacks(self):
+        """Test if fallbacks resolved in the database match the ones resolved in Python."""
+        b = models.ManagerTestModel.objects.create(title_en='b en', title_de='')
+        a = models.ManagerTestModel.objects.create(title_en='c en', title_de='a de')
+        empty = models.ManagerTestModel.objects.create(title_en='', title_de='')
+
+        with reload_override_settings(MODELTRANSLATION_FALLBACK_LANGUAGES=('en',)):
+            with override('de'):
+                qs = models.ManagerTestModel.objects.order_by('pk')
+                self.assertEqual(list(qs.values_list('title', flat=True)),
+                                 list(qs.sql_fallbacks().values_list('title', flat=True)))
+                self.assertEqual(['', 'a de', 'b en'],
+                                 list(qs.sql_fallbacks().order_by('title').values_list('title', flat=True)))
+                self.assertEqual([{'id': b.pk, 'title': 'b en'}],
+                                 list(qs.sql_fallbacks().filter(title__endswith='en').values('id', 'title')))
+                self.assertEqual([empty.pk, a.pk, b.pk], [m.pk for m in qs.sql_fallbacks().order_by('title')])
+                # Lookups on a language field are not affected
+                self.assertEqual(1, qs.sql_fallbacks().filter(title_de='a de').count())
+
+    def test_defer_translations(self):
+        """Test if translations of other languages are deferred and loaded together when read."""
+        from modeltranslation.utils import defer_translations
+        pk = models.ManagerTestModel.objects.create(title_en='en', title_de='de', description_de='desc de').pk
+
+        with defer_translations():
+            n = models.ManagerTestModel.objects.get(pk=pk)
+            self.assertEqual({'title', 'title_de', 'visits', 'visits_de', 'description', 'description_de'},
+                             n.get_deferred_fields())
+            self.assertEqual('en', n.title)
+            with self.assertNumQueries(1):
+                self.assertEqual('de', n.title_de)
+                self.assertEqual('desc de', n.description_de)
+
+            n.title = 'changed'
+            n.save()
+            self.assertEqual('de', models.ManagerTestModel.objects.get(pk=pk).title_de)
+            self.assertEqual('changed', models.ManagerTestModel.objects.get(pk=pk).title_en)
+
+            n = models.ManagerTestModel.objects.defer_translations(False).get(pk=pk)
+            self.assertEqual(set(), n.get_deferred_fields())
+        n = models.ManagerTestModel.objects.get(pk=pk)
+        self.assertEqual(set(), n.get_deferred_fields())
+
     def test_filter_update(self):
         """Test if filtering and updating is language-aware."""
         n = models.ManagerTestModel(title='')
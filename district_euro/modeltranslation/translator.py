@@ -11,7 +11,8 @@ from modeltranslation.fields import (NONE, create_translation_field, Translation
                                      TranslatedRelationIdDescriptor,
                                      LanguageCacheSingleObjectDescriptor)
 from modeltranslation.manager import (MultilingualManager, MultilingualQuerysetManager,
-                                      rewrite_lookup_key, append_translated)
+                                      rewrite_lookup_key, append_translated, clear_lookup_caches,
+                                      get_deferrable_translation_fields)
 from modeltranslation.utils import build_localized_fieldname, parse_field
 
 
@@ -301,6 +302,14 @@ def patch_refresh_from_db(model):
     def new_refresh_from_db(self, using=None, fields=None):
         if fields is not None:
             fields = append_translated(self.__class__, fields)
+            deferred = self.get_deferred_fields()
+            # Original fields are left out, setting them goes through the translation descriptor.
+            original = translator.get_options_for_model(self.__class__).fields
+            deferred_translations = set(name for name in get_deferrable_translation_fields(self.__class__)
+                                        if name in deferred and name not in original)
+            if deferred_translations and fields & deferred:
+                # Translations deferred by ``defer_translations`` are loaded together.
+                fields |= deferred_translations
         return old_refresh_from_db(self, using, fields)
     model.refresh_from_db = new_refresh_from_db
 
@@ -442,12 +451,17 @@ class Translator(object):
                     raise AlreadyRegistered(
                         'Model "%s" is already registered for translation' %
                         model.__name__)
-                else:
-                    descendants = [d.__name__ for d in self._registry.keys()
-                                   if issubclass(d, model) and d != model]
+                descendants = [d.__name__ for d, d_opts in self._registry.items()
+                               if issubclass(d, model) and d != model and d_opts.registered]
+                if descendants:
                     raise DescendantRegistered(
                         'Model "%s" cannot be registered after its subclass'
                         ' "%s"' % (model.__name__, descendants[0]))
+                # Options cached by lookups made before the model was
+                # registered, and the ones its subclasses inherited.
+                for desc in list(self._registry):
+                    if issubclass(desc, model):
+                        del self._registry[desc]
 
             # Find inherited fields and create options instance for the model.
             opts = self._get_options_for_model(model, opts_class, **options)
@@ -458,6 +472,9 @@ class Translator(object):
             except Exception:
                 self._registry[model].registered = False
                 raise
+            finally:
+                # Lookups rewritten until now do not know about this model.
+                clear_lookup_caches()
 
     def _register_single_model(self, model, opts):
         # Now, when all fields are initialized and inherited, validate configuration.
@@ -569,6 +586,7 @@ class Translator(object):
                         ' unregistering its base "%s"' %
                         (desc.__name__, model.__name__))
                 del self._registry[desc]
+            clear_lookup_caches()
 
     def get_registered_models(self, abstract=True):
         """
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import threading
 from contextlib import contextmanager
 
 from django.utils import six
@@ -167,6 +168,51 @@ def fallbacks(enable=True):
         settings.ENABLE_FALLBACKS = current_enable_fallbacks
 
 
+_defer_translations = threading.local()
+
+
+@contextmanager
+def defer_translations(enable=True):
+    """
+    Temporarily switch deferring translation columns of languages the active
+    language does not fall back to, in the current thread only.
+
+    Example:
+
+        with defer_translations():
+            products = list(Product.objects.all())
+        products[0].description  // Loaded
+        products[0].description_zh_hans  // Loaded now, with every other deferred translation
+
+    Meant to wrap requests rendering a single language.
+    """
+    current_defer_translations = getattr(_defer_translations, 'enabled', None)
+    _defer_translations.enabled = enable
+    try:
+        yield
+    finally:
+        _defer_translations.enabled = current_defer_translations
+
+
+def set_translations_deferred(enable):
+    """
+    Switch deferring translation columns in the current thread until switched
+    again, ``None`` follows the ``DEFER_TRANSLATIONS`` setting.
+
+    For code that can not wrap its work in ``defer_translations``, like
+    middlewares.
+    """
+    _defer_translations.enabled = enable
+
+
+def translations_deferred():
+    """
+    Return whether translation columns of other languages are deferred in the current thread.
+    """
+    enabled = getattr(_defer_translations, 'enabled', None)
+    return settings.DEFER_TRANSLATIONS if enabled is None else enabled
+
+
 def parse_field(setting, field_name, default):
     """
     Extract result from single-value or dict-type setting like fallback_values.